@@ -14,7 +14,12 @@ echo   Resolve Production Suite Installer
 echo ============================================
 echo.
 
-REM Check for standalone executable first
+REM Check for standalone executable first (one-folder build, then --single-file)
+if exist "%~dp0dist\Setup\Setup.exe" (
+    echo Found standalone installer...
+    start "" "%~dp0dist\Setup\Setup.exe"
+    exit /b 0
+)
 if exist "%~dp0dist\Setup.exe" (
     echo Found standalone installer...
     start "" "%~dp0dist\Setup.exe"
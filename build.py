@@ -3,18 +3,24 @@
 Build standalone installer for Resolve Production Suite.
 
 Usage:
-    python build.py          # Build for current platform
-    python build.py --clean  # Clean build first
+    python build.py                # Build for current platform
+    python build.py --clean        # Full rebuild (ignore PyInstaller's build/ cache)
+    python build.py --single-file  # Build a self-extracting single executable
 
 Output:
+    dist/ResolveProductionSuite-Setup/      (folder with the executable)
+    dist/ResolveProductionSuite-Setup.zip   (the folder, zipped for distribution)
+
+    With --single-file:
     Windows: dist/ResolveProductionSuite-Setup.exe
-    macOS:   dist/ResolveProductionSuite-Setup (or .app)
+    macOS:   dist/ResolveProductionSuite-Setup
     Linux:   dist/ResolveProductionSuite-Setup
 
 Requirements:
     pip install pyinstaller
 """
 
+import hashlib
 import os
 import platform
 import shutil
@@ -24,10 +30,25 @@ from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 
+# Standard library modules installer.py never imports
+EXCLUDED_MODULES = ["tkinter", "test", "unittest", "pydoc", "xmlrpc"]
+
+
+def spec_fingerprint(cmd):
+    """Hash the PyInstaller options and requirements a generated .spec bakes in."""
+    digest = hashlib.sha256("\0".join(cmd).encode())
+    req_file = SCRIPT_DIR / "requirements.txt"
+    if req_file.exists():
+        digest.update(req_file.read_bytes())
+    return digest.hexdigest()
+
 
 def main():
-    # Clean if requested
-    if "--clean" in sys.argv:
+    single_file = "--single-file" in sys.argv
+    clean = "--clean" in sys.argv
+
+    # Clean if requested. Otherwise PyInstaller reuses its analysis cache in build/
+    if clean:
         print("Cleaning...")
         shutil.rmtree(SCRIPT_DIR / "build", ignore_errors=True)
         shutil.rmtree(SCRIPT_DIR / "dist", ignore_errors=True)
@@ -62,30 +83,69 @@ def main():
         "sample_data", "docs"
     ]
 
+    # One directory read instead of a stat per item
+    with os.scandir(SCRIPT_DIR) as it:
+        present = {entry.name: entry for entry in it}
+
     for item in data_items:
+        entry = present.get(item)
+        if entry is None:
+            continue
         src = SCRIPT_DIR / item
-        if src.exists():
-            dest = "." if src.is_file() else item
-            data_args.extend(["--add-data", f"{src}{sep}{dest}"])
+        if entry.is_dir():
+            # Don't ship stale bytecode alongside the sources; PyInstaller compiles its own
+            for pycache in src.glob("**/__pycache__"):
+                shutil.rmtree(pycache, ignore_errors=True)
+        dest = "." if entry.is_file() else item
+        data_args.extend(["--add-data", f"{src}{sep}{dest}"])
+
+    # installer.py is console-only and stdlib-only; keep unused modules out of the bundle
+    exclude_args = []
+    for module in EXCLUDED_MODULES:
+        exclude_args.extend(["--exclude-module", module])
 
     cmd = [
         sys.executable, "-m", "PyInstaller",
         str(SCRIPT_DIR / "installer.py"),
-        "--onefile",
+        "--onefile" if single_file else "--onedir",
         "--console",
         f"--name={name}",
-        "--clean",
         "--noconfirm",
-    ] + data_args
+        "--noupx",  # UPX-packed binaries must be decompressed on every launch
+    ] + exclude_args + data_args
+    if system != "Windows":
+        cmd.append("--strip")
+
+    # PyInstaller writes {name}.spec on every flag-based run. Reuse it while the
+    # options and requirements that produced it are unchanged.
+    spec = SCRIPT_DIR / f"{name}.spec"
+    stamp = SCRIPT_DIR / "build" / f"{name}.spec.sha256"
+    fingerprint = spec_fingerprint(cmd)
+    if clean:
+        cmd.append("--clean")
+    elif spec.exists() and stamp.exists() and stamp.read_text().strip() == fingerprint:
+        print(f"Reusing {spec.name}")
+        cmd = [sys.executable, "-m", "PyInstaller", str(spec), "--noconfirm"]
+
+    # PyInstaller compiles bundled modules with the optimization level it runs at
+    env = {**os.environ, "PYTHONOPTIMIZE": "1"}
 
     print(f"\nBuilding for {system}...")
-    result = subprocess.run(cmd, cwd=SCRIPT_DIR)
+    result = subprocess.run(cmd, cwd=SCRIPT_DIR, env=env)
 
     if result.returncode == 0:
-        if system == "Windows":
-            output = SCRIPT_DIR / "dist" / f"{name}.exe"
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(fingerprint)
+
+        exe_name = f"{name}.exe" if system == "Windows" else name
+        if single_file:
+            output = SCRIPT_DIR / "dist" / exe_name
         else:
-            output = SCRIPT_DIR / "dist" / name
+            # One-folder build: ship the folder as a zip so it stays one download
+            bundle_dir = SCRIPT_DIR / "dist" / name
+            archive = shutil.make_archive(str(bundle_dir), "zip", bundle_dir.parent, name)
+            print(f"Archive: {archive}")
+            output = bundle_dir / exe_name
 
         print(f"\n{'='*50}")
         print("BUILD SUCCESSFUL!")
@@ -94,8 +154,12 @@ def main():
         if output.exists():
             size = output.stat().st_size / (1024 * 1024)
             print(f"Size: {size:.1f} MB")
-        print("\nThis is your standalone installer!")
-        print("Users just double-click - no Python needed.")
+        if single_file:
+            print("\nThis is your standalone installer!")
+            print("Users just double-click - no Python needed.")
+        else:
+            print("\nDistribute the zip - users extract it and double-click")
+            print(f"{exe_name} inside. No Python needed.")
     else:
         print("\nBuild failed!")
         sys.exit(1)
@@ -11,8 +11,13 @@ Prerequisites:
     pip install pyinstaller
 
 Usage:
-    python build_installer.py          # Build for current platform
-    python build_installer.py --all    # Build for all platforms (requires cross-compilation setup)
+    python build_installer.py                # Build for current platform
+    python build_installer.py --single-file  # Build self-extracting single executables
+    python build_installer.py --clean        # Full rebuild (ignore PyInstaller's build/ cache)
+    python build_installer.py --all          # Build for all platforms (requires cross-compilation setup)
+
+By default PyInstaller builds a folder (fast startup, nothing is unpacked to a
+temp dir on launch) and the folder is zipped for distribution.
 """
 
 import argparse
@@ -23,10 +28,13 @@ import subprocess
 import sys
 from pathlib import Path
 
+from build import spec_fingerprint
+
 SCRIPT_DIR = Path(__file__).parent.resolve()
 DIST_DIR = SCRIPT_DIR / "dist"
 BUILD_DIR = SCRIPT_DIR / "build"
 VERSION = (SCRIPT_DIR / "VERSION").read_text().strip() if (SCRIPT_DIR / "VERSION").exists() else "0.2.0"
+SYSTEM = platform.system()
 
 # Files to include in the bundle
 DATA_FILES = [
@@ -60,25 +68,55 @@ def check_pyinstaller():
         return True
 
 
-def build_installer():
+def reuse_spec(cmd, name, clean):
+    """Swap cmd for a run of the .spec PyInstaller generated last time, if current.
+
+    Returns (command to run, stamp file, fingerprint); write the fingerprint
+    to the stamp once the build succeeds.
+    """
+    spec = SCRIPT_DIR / f"{name}.spec"
+    stamp = BUILD_DIR / f"{name}.spec.sha256"
+    fingerprint = spec_fingerprint(cmd)
+    if clean:
+        cmd = cmd + ["--clean"]  # Discard the incremental build cache
+    elif spec.exists() and stamp.exists() and stamp.read_text().strip() == fingerprint:
+        print(f"Reusing {spec.name}")
+        cmd = [
+            sys.executable, "-m", "PyInstaller", str(spec),
+            f"--distpath={DIST_DIR}",
+            f"--workpath={BUILD_DIR}",
+            "--noconfirm",
+        ]
+    return cmd, stamp, fingerprint
+
+
+def archive_bundle(name):
+    """Zip a one-folder build in dist/ for distribution."""
+    archive = shutil.make_archive(str(DIST_DIR / name), "zip", DIST_DIR, name)
+    print(f"Archive: {archive}")
+    return Path(archive)
+
+
+def build_installer(single_file=False, clean=False):
     """Build the standalone installer executable."""
     print(f"\n{'='*60}")
     print(f"Building Resolve Production Suite Installer v{VERSION}")
-    print(f"Platform: {platform.system()}")
+    print(f"Platform: {SYSTEM}")
     print(f"{'='*60}\n")
 
     # Prepare data files argument
     datas = []
+    with os.scandir(SCRIPT_DIR) as it:
+        present = {entry.name for entry in it}
     for src, dst in DATA_FILES:
-        src_path = SCRIPT_DIR / src
-        if src_path.exists():
-            datas.append(f"--add-data={src_path}{os.pathsep}{dst}")
+        if src in present:
+            datas.append(f"--add-data={SCRIPT_DIR / src}{os.pathsep}{dst}")
 
     # Determine output name based on platform
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         name = "Setup"
         icon_arg = []  # Add --icon=path/to/icon.ico if you have one
-    elif platform.system() == "Darwin":
+    elif SYSTEM == "Darwin":
         name = "Setup"
         icon_arg = []  # Add --icon=path/to/icon.icns if you have one
     else:
@@ -88,29 +126,36 @@ def build_installer():
     # PyInstaller command
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",           # Single executable
+        "--onefile" if single_file else "--onedir",
         "--windowed",          # No console window (GUI app)
         f"--name={name}",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        "--clean",             # Clean build
         "--noconfirm",         # Don't ask for confirmation
     ] + icon_arg + datas + [
         str(SCRIPT_DIR / "installer_gui.py")
     ]
 
+    # Reuse the .spec PyInstaller generated last time while its inputs are unchanged
+    cmd, stamp, fingerprint = reuse_spec(cmd, name, clean)
+
     print("Running PyInstaller...")
     print(f"Command: {' '.join(cmd[:10])}...")
 
     result = subprocess.run(cmd, cwd=SCRIPT_DIR)
 
     if result.returncode == 0:
-        if platform.system() == "Windows":
-            exe_path = DIST_DIR / "Setup.exe"
-        elif platform.system() == "Darwin":
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(fingerprint)
+
+        if SYSTEM == "Darwin":
             exe_path = DIST_DIR / "Setup.app"
+        elif single_file:
+            exe_path = DIST_DIR / ("Setup.exe" if SYSTEM == "Windows" else "setup")
         else:
-            exe_path = DIST_DIR / "setup"
+            exe_name = "Setup.exe" if SYSTEM == "Windows" else "setup"
+            exe_path = DIST_DIR / name / exe_name
+            archive_bundle(name)
 
         print(f"\n{'='*60}")
         print("BUILD SUCCESSFUL!")
@@ -119,25 +164,27 @@ def build_installer():
         if exe_path.exists():
             size = exe_path.stat().st_size / (1024 * 1024)
             print(f"Size: {size:.1f} MB")
-        print("\nThis executable can be distributed directly.")
+        if single_file or SYSTEM == "Darwin":
+            print("\nThis executable can be distributed directly.")
+        else:
+            print(f"\nDistribute {name}.zip - users extract it and run the executable inside.")
         print("Users just double-click to install - no Python needed!")
     else:
         print("\nBuild failed!")
         sys.exit(1)
 
 
-def build_cli():
+def build_cli(single_file=False, clean=False):
     """Build standalone CLI executable."""
     print("\nBuilding CLI executable...")
 
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        "--onefile" if single_file else "--onedir",
         "--console",  # Keep console for CLI
         "--name=resolve-suite",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        "--clean",
         "--noconfirm",
         "--add-data", f"{SCRIPT_DIR / 'VERSION'}{os.pathsep}.",
         "--add-data", f"{SCRIPT_DIR / 'core'}{os.pathsep}core",
@@ -147,9 +194,14 @@ def build_cli():
         "--add-data", f"{SCRIPT_DIR / 'scripts'}{os.pathsep}scripts",
         str(SCRIPT_DIR / "cli" / "main.py")
     ]
+    cmd, stamp, fingerprint = reuse_spec(cmd, "resolve-suite", clean)
 
     result = subprocess.run(cmd, cwd=SCRIPT_DIR)
     if result.returncode == 0:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(fingerprint)
+        if not single_file:
+            archive_bundle("resolve-suite")
         print("CLI executable built successfully!")
 
 
@@ -157,6 +209,8 @@ def main():
     parser = argparse.ArgumentParser(description="Build standalone executables")
     parser.add_argument("--cli", action="store_true", help="Also build CLI executable")
     parser.add_argument("--clean", action="store_true", help="Clean build directories first")
+    parser.add_argument("--single-file", action="store_true",
+                        help="Build self-extracting single executables instead of folders")
     args = parser.parse_args()
 
     if args.clean:
@@ -168,10 +222,10 @@ def main():
             f.unlink() if f.is_file() else shutil.rmtree(f)
 
     check_pyinstaller()
-    build_installer()
+    build_installer(single_file=args.single_file, clean=args.clean)
 
     if args.cli:
-        build_cli()
+        build_cli(single_file=args.single_file, clean=args.clean)
 
 
 if __name__ == "__main__":
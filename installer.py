@@ -7,20 +7,20 @@ No external dependencies required - works with any Python 3.9+
 
 For standalone distribution, build with:
     pip install pyinstaller
-    pyinstaller --onefile --console --name=ResolveProductionSuite-Setup installer.py
+    pyinstaller --onedir --console --name=ResolveProductionSuite-Setup installer.py
 """
 
-import json
+import contextlib
+import errno
+import functools
+import io
 import os
 import platform
+import re
 import shutil
-import subprocess
 import sys
-import tempfile
-import urllib.request
-import urllib.error
-import webbrowser
-import zipfile
+import time
+import traceback
 from pathlib import Path
 
 # =============================================================================
@@ -29,9 +29,55 @@ from pathlib import Path
 
 VERSION = "0.3.16"
 MIN_PYTHON = (3, 9)
-IS_WINDOWS = platform.system() == "Windows"
-IS_MACOS = platform.system() == "Darwin"
-IS_LINUX = platform.system() == "Linux"
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"
+IS_MACOS = SYSTEM == "Darwin"
+IS_LINUX = SYSTEM == "Linux"
+
+if IS_WINDOWS:
+    import winreg
+
+# Default install location and per-user data directory (logs, reports, caches)
+if IS_WINDOWS:
+    DEFAULT_INSTALL_DIR = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
+else:
+    DEFAULT_INSTALL_DIR = Path.home() / ".local" / "share" / "resolve-production-suite"
+DATA_DIR = Path.home() / ".rps"
+
+# Desktop shortcut file name on this platform
+if IS_WINDOWS:
+    SHORTCUT_NAME = "Resolve Production Suite.lnk"
+elif IS_MACOS:
+    SHORTCUT_NAME = "Resolve Production Suite.command"
+elif IS_LINUX:
+    SHORTCUT_NAME = "resolve-production-suite.desktop"
+else:
+    SHORTCUT_NAME = None
+
+# Where Resolve's scripting modules live on this platform
+if IS_LINUX:
+    RESOLVE_MODULE_PATHS = (
+        "/opt/resolve/Developer/Scripting/Modules",
+        "/opt/blackmagic/DaVinci Resolve/Developer/Scripting/Modules",
+    )
+elif IS_MACOS:
+    RESOLVE_MODULE_PATHS = (
+        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+    )
+elif IS_WINDOWS:
+    RESOLVE_MODULE_PATHS = (
+        r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting\Modules",
+        r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Developer\Scripting\Modules",
+    )
+else:
+    RESOLVE_MODULE_PATHS = ()
+
+# In a console, child processes share it and their output (pip progress and
+# errors) must stay visible there. Only a windowless launch (pythonw or a
+# windowed build, where sys.stdout is None) would open a conhost.exe window
+# per child, so only then pass subprocess.CREATE_NO_WINDOW (spelled out so
+# subprocess is imported lazily).
+SUBPROCESS_FLAGS = 0x08000000 if IS_WINDOWS and sys.stdout is None else 0
 
 # GitHub repository for updates
 GITHUB_USER = "contactmukundthiru-cyber"
@@ -55,10 +101,22 @@ else:
 # Console Helpers
 # =============================================================================
 
+def _enable_windows_ansi():
+    """Turn on ANSI escape handling for the Windows console (no subprocess)."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (OSError, AttributeError):
+        pass
+
+
 class Colors:
-    if IS_WINDOWS:
-        # Enable ANSI on Windows
-        os.system('')
+    if IS_WINDOWS and sys.stdout is not None and sys.stdout.isatty():
+        _enable_windows_ansi()
 
     HEADER = '\033[95m'
     BLUE = '\033[94m'
@@ -74,15 +132,31 @@ def clear_screen():
     os.system('cls' if IS_WINDOWS else 'clear')
 
 
+def print_block(lines):
+    """Write several lines with one write and one flush.
+
+    Each print() is its own console write, which is slow on Windows consoles.
+    Without a console (pythonw, windowed builds) sys.stdout is None and
+    print() already discards the output, so fall back to it.
+    """
+    if sys.stdout is None:
+        print("\n".join(lines))
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def print_header():
     clear_screen()
-    print(f"{Colors.CYAN}")
-    print("=" * 60)
-    print("      RESOLVE PRODUCTION SUITE INSTALLER")
-    print(f"              Version {VERSION}")
-    print("=" * 60)
-    print(f"{Colors.END}")
-    print()
+    print_block([
+        f"{Colors.CYAN}",
+        "=" * 60,
+        "      RESOLVE PRODUCTION SUITE INSTALLER",
+        f"              Version {VERSION}",
+        "=" * 60,
+        f"{Colors.END}",
+        "",
+    ])
 
 
 def print_step(msg):
@@ -135,67 +209,171 @@ def wait_for_key():
 # Updater
 # =============================================================================
 
+# Pre-release tags in the order they sort; a final release ranks above all of them
+PRERELEASE_RANK = {"dev": 0, "a": 1, "alpha": 1, "b": 2, "beta": 2, "rc": 3, "c": 3, "pre": 3}
+VERSION_RE = re.compile(r"v?(\d+(?:\.\d+)*)(?:[-._]?([a-z]+)[-._]?(\d*))?", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
 def parse_version(version_str):
-    """Parse version string into comparable tuple."""
+    """Parse version string into comparable tuple.
+
+    "1.2.0-rc1" sorts before "1.2.0", and trailing ".0" parts are ignored.
+    """
+    match = VERSION_RE.match(version_str.strip()) if isinstance(version_str, str) else None
+    if not match:
+        return ((0,), len(PRERELEASE_RANK), 0)
+
+    release = [int(p) for p in match.group(1).split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    tag = (match.group(2) or "").lower()
+    rank = PRERELEASE_RANK.get(tag, len(PRERELEASE_RANK))
+    return (tuple(release), rank, int(match.group(3) or 0) if tag in PRERELEASE_RANK else 0)
+
+
+# Platform token in release asset names, e.g. ResolveProductionSuite-macOS.zip
+ASSET_PLATFORM_RE = re.compile(r"(windows|mac(?:os)?|linux)", re.IGNORECASE)
+
+# Update checks within this many seconds reuse the cached response outright
+UPDATE_CACHE_TTL = 60 * 60
+
+
+def _load_cache():
+    """Load cached update-check responses from the data directory."""
+    import json
     try:
-        clean = version_str.strip().split("-")[0]
-        return tuple(int(p) for p in clean.split("."))
-    except (ValueError, AttributeError):
-        return (0, 0, 0)
+        with open(get_data_dir() / "update_cache.json", "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
 
 
-def get_update_info():
-    """Get update information from GitHub."""
-    # Try version.json first (faster, simpler)
+def _save_cache(cache):
+    """Persist cached update-check responses (best effort)."""
+    import json
     try:
-        req = urllib.request.Request(
-            VERSION_CHECK_URL,
-            headers={"User-Agent": "ResolveProductionSuite-Installer"}
-        )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return {
-                "version": data.get("version", "0.0.0"),
-                "changelog": data.get("changelog", ""),
-                "download_url": data.get("download_url"),
-                "windows_url": data.get("windows_url"),
-                "macos_url": data.get("macos_url"),
-            }
-    except Exception:
+        data_dir = get_data_dir()
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "update_cache.json").write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
         pass
 
-    # Fallback to GitHub Releases API
+
+def _fetch_json(url, cache):
+    """Fetch a JSON document, revalidating against the cached copy.
+
+    A fresh cache entry is returned without touching the network; otherwise the
+    request carries If-None-Match/If-Modified-Since so an unchanged document
+    comes back as an empty 304. The cache dict is updated in place; the
+    caller saves it.
+    """
+    import json
+    import urllib.error
+    import urllib.request
+    entry = cache.get(url)
+    if entry and time.time() - entry.get("fetched_at", 0) < UPDATE_CACHE_TTL:
+        return entry["body"]
+
+    headers = {"User-Agent": "ResolveProductionSuite-Installer"}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    req = urllib.request.Request(url, headers=headers)
     try:
-        req = urllib.request.Request(
-            RELEASES_API_URL,
-            headers={"User-Agent": "ResolveProductionSuite-Installer"}
-        )
         with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            version = data.get("tag_name", "0.0.0").lstrip("v")
-            changelog = data.get("body", "")
-
-            # Find platform-specific download
-            assets = data.get("assets", [])
-            windows_url = None
-            macos_url = None
-            for asset in assets:
-                name = asset.get("name", "").lower()
-                url = asset.get("browser_download_url")
-                if "windows" in name:
-                    windows_url = url
-                elif "macos" in name or "mac" in name:
-                    macos_url = url
-
-            return {
-                "version": version,
-                "changelog": changelog,
-                "download_url": data.get("html_url"),
-                "windows_url": windows_url,
-                "macos_url": macos_url,
+            # json.loads takes the raw bytes (UTF-8 is detected), no decoded copy
+            body = json.loads(response.read())
+            cache[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body": body,
+                "fetched_at": time.time(),
             }
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not entry:
+            raise
+        body = entry["body"]
+        entry["fetched_at"] = time.time()
+
+    return body
+
+
+def _pin_release_url(url, version):
+    """Point a releases/latest/download/ asset URL at the release tagged v<version>.
+
+    version.json can come from the update cache, so "latest" may already be a
+    newer release than the version and checksum it was listed with.
+    """
+    if url and "/releases/latest/download/" in url:
+        return url.replace("/releases/latest/download/", f"/releases/download/v{version}/")
+    return url
+
+
+def _version_json_info(data):
+    """Update info from version.json."""
+    version = data.get("version", "0.0.0")
+    return {
+        "version": version,
+        "changelog": data.get("changelog", ""),
+        "download_url": data.get("download_url"),
+        "windows_url": _pin_release_url(data.get("windows_url"), version),
+        "macos_url": _pin_release_url(data.get("macos_url"), version),
+        "windows_sha256": data.get("windows_sha256"),
+        "macos_sha256": data.get("macos_sha256"),
+    }
+
+
+def _release_info(data):
+    """Update info from a GitHub Releases API response."""
+    version = data.get("tag_name", "0.0.0").lstrip("v")
+    changelog = data.get("body", "")
+
+    # Find platform-specific downloads, keyed by the platform in the asset name.
+    # "<zip name>.sha256" assets carry the checksum of the matching zip.
+    urls = {}
+    for asset in data.get("assets", []):
+        name = asset.get("name", "")
+        m = ASSET_PLATFORM_RE.search(name)
+        if m:
+            key = m.group(1).lower()
+            if name.lower().endswith(".sha256"):
+                key += "_sha256"
+            urls[key] = asset.get("browser_download_url")
+
+    return {
+        "version": version,
+        "changelog": changelog,
+        "download_url": data.get("html_url"),
+        "windows_url": urls.get("windows"),
+        "macos_url": urls.get("macos") or urls.get("mac"),
+        "linux_url": urls.get("linux"),
+        "windows_sha256_url": urls.get("windows_sha256"),
+        "macos_sha256_url": urls.get("macos_sha256") or urls.get("mac_sha256"),
+    }
+
+
+def get_update_info():
+    """Get update information from GitHub.
+
+    version.json is tried first; the Releases API is only asked when that
+    fails, so routine checks don't spend its unauthenticated rate limit.
+    """
+    cache = _load_cache()
+
+    try:
+        info = _version_json_info(_fetch_json(VERSION_CHECK_URL, cache))
     except Exception:
-        return None
+        try:
+            info = _release_info(_fetch_json(RELEASES_API_URL, cache))
+        except Exception:
+            info = None
+
+    _save_cache(cache)
+    return info
 
 
 def check_for_updates():
@@ -225,8 +403,31 @@ def check_for_updates():
         return False, remote_version, info
 
 
-def download_file(url, dest_path, desc="Downloading"):
-    """Download a file with progress indication."""
+# Updates up to this size are downloaded straight into memory
+IN_MEMORY_DOWNLOAD_LIMIT = 64 * 1024 * 1024
+
+
+def _preallocate(f, size):
+    """Reserve size bytes for an open file so it can be laid out in one extent (best effort)."""
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        elif IS_WINDOWS:
+            f.truncate(size)  # SetEndOfFile allocates the space on NTFS
+    except OSError:
+        pass
+
+
+def _download(url, open_dest, desc):
+    """Stream url into the file object returned by open_dest(total_bytes).
+
+    Writes happen on a helper thread fed through a small bounded queue, so
+    the next block is already being received while the previous one is
+    written out.
+    """
+    import queue
+    import threading
+    import urllib.request
     print_step(f"{desc}...")
 
     try:
@@ -234,18 +435,51 @@ def download_file(url, dest_path, desc="Downloading"):
         with urllib.request.urlopen(req, timeout=60) as response:
             total = int(response.headers.get('content-length', 0))
             downloaded = 0
-            block_size = 8192
-
-            with open(dest_path, 'wb') as f:
-                while True:
-                    chunk = response.read(block_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total:
-                        pct = int(downloaded * 100 / total)
-                        print(f"\r  Progress: {pct}% ({downloaded // 1024}KB / {total // 1024}KB)", end="", flush=True)
+            block_size = 1024 * 1024
+            last_print = 0.0
+
+            with open_dest(total) as f:
+                if total and not isinstance(f, io.BytesIO):
+                    _preallocate(f, total)
+                blocks = queue.Queue(maxsize=4)
+                write_errors = []
+
+                def writer():
+                    while True:
+                        block = blocks.get()
+                        if block is None:
+                            return
+                        if not write_errors:
+                            try:
+                                f.write(block)
+                            except Exception as e:
+                                write_errors.append(e)
+
+                write_thread = threading.Thread(target=writer, daemon=True)
+                write_thread.start()
+                try:
+                    while not write_errors:
+                        chunk = response.read(block_size)
+                        if not chunk:
+                            break
+                        blocks.put(chunk)
+                        downloaded += len(chunk)
+                        # Redraw the progress line at most ~10 times a second
+                        now = time.monotonic()
+                        if total and (now - last_print > 0.1 or downloaded == total):
+                            last_print = now
+                            pct = int(downloaded * 100 / total)
+                            print(f"\r  Progress: {pct}% ({downloaded // 1024}KB / {total // 1024}KB)", end="", flush=True)
+                finally:
+                    blocks.put(None)
+                    write_thread.join()
+                if write_errors:
+                    raise write_errors[0]
+                if downloaded < total:
+                    # The connection closed early; a partial file is never usable
+                    print()
+                    print_error(f"Download incomplete: got {downloaded} of {total} bytes")
+                    return False
 
             print()  # New line after progress
             print_success("Download complete!")
@@ -255,39 +489,227 @@ def download_file(url, dest_path, desc="Downloading"):
         return False
 
 
-def apply_update(zip_path, install_dir, is_current_dir=False):
-    """Extract and apply update from zip file."""
-    print_step("Applying update...")
+def download_to_buffer(url, desc="Downloading"):
+    """Download into a seekable binary buffer without a named temp file.
+
+    Payloads of known size up to IN_MEMORY_DOWNLOAD_LIMIT stay in memory;
+    anything else goes to an anonymous temporary file. Returns None on failure.
+    """
+    buffers = []
+
+    def open_dest(total):
+        import tempfile
+        if 0 < total <= IN_MEMORY_DOWNLOAD_LIMIT:
+            buf = io.BytesIO()
+        else:
+            buf = tempfile.TemporaryFile()
+        buffers.append(buf)
+        return contextlib.nullcontext(buf)
+
+    if not _download(url, open_dest, desc):
+        for buf in buffers:
+            buf.close()
+        return None
+
+    buf = buffers[0]
+    buf.seek(0)
+    return buf
+
+
+def _sha256_of(fileobj):
+    """Hex SHA-256 of a binary file object, leaving it rewound."""
+    import hashlib
+    fileobj.seek(0)
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        digest = hashlib.file_digest(fileobj, "sha256")
+    else:
+        digest = hashlib.sha256()
+        for block in iter(lambda: fileobj.read(1024 * 1024), b""):
+            digest.update(block)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+def verify_update(update_zip, info, platform_key):
+    """Check a downloaded update against its published SHA-256.
+
+    The checksum comes from version.json (<platform>_sha256) or from a
+    "<zip name>.sha256" release asset. Returns False only on a mismatch.
+    """
+    import hmac
+    import urllib.request
+    expected = info.get(f"{platform_key}_sha256")
+    checksum_url = info.get(f"{platform_key}_sha256_url")
+    if not expected and checksum_url:
+        try:
+            req = urllib.request.Request(checksum_url, headers={"User-Agent": "ResolveProductionSuite-Installer"})
+            with urllib.request.urlopen(req, timeout=10) as response:
+                expected = response.read().decode().split()[0]
+        except Exception:
+            expected = None
+
+    if not expected:
+        print_warning("No checksum published for this update; skipping verification")
+        return True
+
+    if not hmac.compare_digest(_sha256_of(update_zip), expected.strip().lower()):
+        print_error("Downloaded update is corrupted (checksum mismatch). Nothing was changed.")
+        return False
 
+    print_success("Download verified")
+    return True
+
+
+def cache_update(update_zip, cached_zip):
+    """Keep a verified, extracted update archive so a re-run needs no download (best effort).
+
+    Archives for other versions in the same folder are dropped.
+    """
     try:
-        # Extract to temp location first
-        temp_extract = Path(tempfile.mkdtemp())
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            zf.extractall(temp_extract)
+        cached_zip.parent.mkdir(parents=True, exist_ok=True)
+        for old in cached_zip.parent.glob("rps-*.zip"):
+            old.unlink()
+        partial = cached_zip.with_suffix(".part")
+        update_zip.seek(0)
+        with open(partial, 'wb') as f:
+            shutil.copyfileobj(update_zip, f)
+        os.replace(partial, cached_zip)
+    except OSError:
+        pass
+    finally:
+        update_zip.seek(0)
+
+
+# Names given to directories that remove_tree_later() renamed aside
+TRASH_PREFIX = ".rps-trash-"
+
+
+def remove_tree_later(path, trash_dir=None):
+    """Rename a directory out of the way and delete it on a background thread.
+
+    The rename is instant, so path is free for reuse straight away while the
+    (slow, many-small-files) deletion overlaps with whatever runs next. The
+    thread is non-daemon, so the process finishes the job before exiting.
+    The tree is renamed into trash_dir (default: next to path), which must be
+    on the same volume; pass one outside any folder that is walked later.
+    If the rename fails (e.g. a file is locked on Windows) the tree is
+    removed synchronously and any error propagates as with shutil.rmtree.
+    """
+    import threading
+    trash_dir = trash_dir or path.parent
+    trash = trash_dir / f"{TRASH_PREFIX}{path.name}-{os.getpid()}-{time.monotonic_ns()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=False
+    ).start()
+
+
+def sweep_trash(directory):
+    """Delete, in the background, trees an earlier run left in directory.
+
+    remove_tree_later() loses its pending deletions if the process is killed;
+    this picks them up on the next run.
+    """
+    import threading
+    try:
+        with os.scandir(directory) as it:
+            leftovers = [e.path for e in it if e.name.startswith(TRASH_PREFIX) and e.is_dir()]
+    except OSError:
+        return
+    for leftover in leftovers:
+        threading.Thread(
+            target=shutil.rmtree, args=(leftover,), kwargs={"ignore_errors": True}, daemon=False
+        ).start()
+
+
+def extract_update(update_zip, staging_dir):
+    """Extract an update archive (path or binary file object) into staging_dir.
+
+    Returns the directory holding the package contents, or None on failure.
+    """
+    import concurrent.futures
+    import zipfile
+    print_step("Extracting update...")
+
+    try:
+        if staging_dir.exists():
+            remove_tree_later(staging_dir)
+        staging_dir.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(update_zip, 'r') as zf:
+            # Lay out the directories first, then inflate members on a thread
+            # pool: zlib releases the GIL, so members decompress in parallel
+            members = []
+            for info in zf.infolist():
+                parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".")]
+                if not parts or ".." in parts or ":" in parts[0]:
+                    continue  # empty name, or one that would escape staging_dir
+                dest = staging_dir.joinpath(*parts)
+                if info.is_dir():
+                    dest.mkdir(parents=True, exist_ok=True)
+                else:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    members.append((info, dest))
+
+            def extract_member(info, dest):
+                with zf.open(info) as src, open(dest, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                # Keep the archived timestamp so unchanged files can be
+                # recognised by size + mtime when updating in place
+                mtime = time.mktime(info.date_time + (0, 0, -1))
+                os.utime(dest, (mtime, mtime))
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+                for future in [ex.submit(extract_member, info, dest) for info, dest in members]:
+                    future.result()
 
         # Find the actual content directory (might be nested)
-        content_dir = temp_extract
-        subdirs = list(temp_extract.iterdir())
-        if len(subdirs) == 1 and subdirs[0].is_dir():
-            content_dir = subdirs[0]
+        with os.scandir(staging_dir) as it:
+            entries = list(it)
+        if len(entries) == 1 and entries[0].is_dir():
+            return Path(entries[0].path)
+        return staging_dir
+
+    except Exception as e:
+        print_error(f"Failed to extract update: {e}")
+        return None
+
 
+def apply_update(content_dir, install_dir, is_current_dir=False):
+    """Apply an extracted update from content_dir to install_dir.
+
+    The in-place (current folder) update copies from content_dir; the
+    installed-location update moves content_dir itself into place.
+    """
+    print_step("Applying update...")
+
+    try:
         if is_current_dir:
             # For current directory, copy files individually (avoids locking issues)
             # Skip .venv and other runtime files
             skip_dirs = {'.venv', '__pycache__', '.git'}
 
-            for item in content_dir.iterdir():
+            # scandir entries carry their type and stat from the directory read
+            with os.scandir(content_dir) as it:
+                items = list(it)
+
+            for item in items:
                 if item.name in skip_dirs:
                     continue
 
                 dest = install_dir / item.name
                 try:
-                    if item.is_dir():
-                        if dest.exists():
-                            shutil.rmtree(dest)
-                        shutil.copytree(item, dest)
+                    if item.is_dir(follow_symlinks=False):
+                        if dest.is_file():
+                            dest.unlink()
+                        _sync_tree(item.path, dest)
                     else:
-                        shutil.copy2(item, dest)
+                        st = item.stat()
+                        if not _unchanged(dest, st):
+                            _copy_file(item.path, dest, st)
                 except PermissionError:
                     # File is in use, skip it
                     print_warning(f"Skipped (in use): {item.name}")
@@ -295,31 +717,37 @@ def apply_update(zip_path, install_dir, is_current_dir=False):
 
             print_success("Update applied! Please restart to see new version.")
         else:
-            # For installed location, do full replacement
+            # For installed location, swap the extracted tree into place with renames
             backup_dir = install_dir.parent / f"{install_dir.name}_backup"
             if backup_dir.exists():
-                shutil.rmtree(backup_dir)
+                remove_tree_later(backup_dir)
 
-            # Backup current installation
-            if install_dir.exists():
-                shutil.move(str(install_dir), str(backup_dir))
+            # Backup current installation first: if this fails (e.g. a locked
+            # file on Windows) nothing has moved yet, venv included
+            had_install = install_dir.exists()
+            if had_install:
+                os.rename(install_dir, backup_dir)
 
-            # Copy new files
-            shutil.copytree(content_dir, install_dir)
-
-            # Restore venv if it existed
-            venv_backup = backup_dir / ".venv"
-            if venv_backup.exists():
-                shutil.move(str(venv_backup), str(install_dir / ".venv"))
-
-            # Clean up backup
-            if backup_dir.exists():
-                shutil.rmtree(backup_dir)
+            # Carry the existing venv over to the new tree, then move it into place
+            old_venv = backup_dir / ".venv"
+            new_venv = content_dir / ".venv"
+            try:
+                if had_install and old_venv.exists():
+                    os.rename(old_venv, new_venv)
+                os.rename(content_dir, install_dir)
+            except OSError:
+                # Put the previous installation (and its venv) back
+                if new_venv.exists():
+                    os.rename(new_venv, old_venv)
+                if had_install:
+                    os.rename(backup_dir, install_dir)
+                raise
+
+            # The old files are no longer needed; delete them without making the user wait
+            remove_tree_later(backup_dir)
 
             print_success("Update applied successfully!")
 
-        # Clean up temp
-        shutil.rmtree(temp_extract)
         return True
 
     except Exception as e:
@@ -329,6 +757,7 @@ def apply_update(zip_path, install_dir, is_current_dir=False):
 
 def run_updater():
     """Run the updater interface."""
+    import webbrowser
     print_header()
     print("UPDATE CHECKER\n")
 
@@ -341,14 +770,15 @@ def run_updater():
 
     # Determine which download URL to use
     if IS_WINDOWS:
-        auto_url = info.get("windows_url")
+        platform_key = "windows"
         platform_name = "Windows"
     elif IS_MACOS:
-        auto_url = info.get("macos_url")
+        platform_key = "macos"
         platform_name = "macOS"
     else:
-        auto_url = None
+        platform_key = None
         platform_name = "your platform"
+    auto_url = info.get(f"{platform_key}_url") if platform_key else None
 
     print("\nUpdate options:")
     print("  1. Auto-update (download and install automatically)")
@@ -360,35 +790,57 @@ def run_updater():
 
     if choice == "1":
         if auto_url:
-            # Auto-download and install
-            with tempfile.TemporaryDirectory() as tmp:
-                zip_path = Path(tmp) / f"update-{remote_version}.zip"
-                if download_file(auto_url, zip_path, f"Downloading {platform_name} update"):
-                    # Find existing installation
-                    if IS_WINDOWS:
-                        install_dir = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
-                    else:
-                        install_dir = Path.home() / ".local" / "share" / "resolve-production-suite"
-
+            # Auto-download and install, reusing an archive kept from an earlier run
+            cached_zip = get_data_dir() / "updates" / f"rps-{remote_version}-{platform_key}.zip"
+            if cached_zip.exists():
+                print_step(f"Using previously downloaded {platform_name} update")
+                update_zip = open(cached_zip, 'rb')
+            else:
+                update_zip = download_to_buffer(auto_url, f"Downloading {platform_name} update")
+            if update_zip and not verify_update(update_zip, info, platform_key):
+                update_zip.close()
+                update_zip = None
+                cached_zip.unlink(missing_ok=True)
+            if update_zip:
+                # Find existing installation
+                install_dir = get_install_path()
+                sweep_trash(install_dir.parent)
+
+                # Extract once, next to install_dir so the swap into place is
+                # a same-filesystem rename
+                staging_dir = install_dir.parent / f".{install_dir.name}.new"
+                with update_zip:
+                    content_dir = extract_update(update_zip, staging_dir)
+                    # Only keep an archive that extracted; a corrupt one would
+                    # otherwise be reused (and fail) on every later run
+                    if content_dir and not cached_zip.exists():
+                        cache_update(update_zip, cached_zip)
+                if not content_dir:
+                    cached_zip.unlink(missing_ok=True)
+
+                if content_dir:
                     updated = False
-
-                    # Update installed location if it exists
-                    if install_dir.exists():
-                        if apply_update(zip_path, install_dir, is_current_dir=False):
-                            updated = True
-
-                    # Also update the current folder if different from install_dir
-                    # (handles case where user runs from download folder)
-                    current_dir = BUNDLE_DIR
-                    if current_dir.resolve() != install_dir.resolve() and current_dir.exists():
-                        # Check if this looks like our package (has installer.py)
-                        if (current_dir / "installer.py").exists():
-                            print_step("Updating current folder...")
-                            # Re-download since we already extracted once
-                            if download_file(auto_url, zip_path, "Downloading for current folder"):
-                                if apply_update(zip_path, current_dir, is_current_dir=True):
+                    try:
+                        # Also update the current folder if different from install_dir
+                        # (handles case where user runs from download folder). This
+                        # copies from the extracted tree, so it goes before the
+                        # installed-location update moves that tree away.
+                        current_dir = BUNDLE_DIR
+                        if current_dir.resolve() != install_dir.resolve() and current_dir.exists():
+                            # Check if this looks like our package (has installer.py)
+                            if (current_dir / "installer.py").exists():
+                                print_step("Updating current folder...")
+                                if apply_update(content_dir, current_dir, is_current_dir=True):
                                     updated = True
 
+                        # Update installed location if it exists
+                        if install_dir.exists():
+                            if apply_update(content_dir, install_dir, is_current_dir=False):
+                                updated = True
+                    finally:
+                        if staging_dir.exists():
+                            remove_tree_later(staging_dir)
+
                     if updated:
                         # Ensure desktop shortcut exists after update
                         ensure_desktop_shortcut(install_dir)
@@ -427,10 +879,7 @@ def run_updater():
 
 def get_install_dir():
     """Get the installation directory."""
-    if IS_WINDOWS:
-        default = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
-    else:
-        default = Path.home() / ".local" / "share" / "resolve-production-suite"
+    default = get_install_path()
 
     print(f"\nInstallation directory: {default}")
     if prompt("Use this location?"):
@@ -442,62 +891,311 @@ def get_install_dir():
 
 def get_data_dir():
     """Get the data directory for logs, reports, etc."""
-    return Path.home() / ".rps"
+    return DATA_DIR
 
 
+@functools.lru_cache(maxsize=1)
 def detect_resolve():
     """Detect DaVinci Resolve installation."""
-    paths = []
-
-    if IS_LINUX:
-        paths = [
-            "/opt/resolve/Developer/Scripting/Modules",
-            "/opt/blackmagic/DaVinci Resolve/Developer/Scripting/Modules"
-        ]
-    elif IS_MACOS:
-        paths = [
-            "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"
-        ]
-    elif IS_WINDOWS:
-        paths = [
-            r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting\Modules",
-            r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Developer\Scripting\Modules"
-        ]
-
     # Check environment variable first
     env_path = os.environ.get("RESOLVE_SCRIPT_API", "")
     if env_path and Path(env_path).exists():
         return env_path
 
     # Check common paths
-    for p in paths:
-        if Path(p).exists():
+    for p in RESOLVE_MODULE_PATHS:
+        if os.path.exists(p):
             return p
 
     return None
 
 
+def _run_in_background(fn):
+    """Start fn() on a worker thread and return its Future.
+
+    Used to overlap filesystem probes with the time the user spends reading
+    the menu and answering prompts.
+    """
+    import concurrent.futures
+    ex = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    future = ex.submit(fn)
+    ex.shutdown(wait=False)
+    return future
+
+
+# Copy large files in 4 MB blocks where shutil falls back to a read/write loop
+# (the default is 64 KB on Windows and 64 KB/16 KB elsewhere)
+shutil.COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+# os.copy_file_range exists on Linux only; the kernel turns it into a reflink
+# on CoW filesystems and an in-kernel copy elsewhere
+_copy_range_supported = hasattr(os, "copy_file_range")
+
+
+def _copy_file_range(src, dst, size):
+    """Copy file data with os.copy_file_range.
+
+    Returns False if it can't be used or stops before size bytes.
+    """
+    global _copy_range_supported
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                if n == 0:
+                    # Short copy (e.g. a pseudo-file or one that shrank):
+                    # let the caller redo it with a plain copy
+                    return False
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in CLONE_UNSUPPORTED_ERRNOS:
+                raise
+            _copy_range_supported = False
+            return False
+    return True
+
+
+def _win_copy(src, dst):
+    """Copy with CopyFile2 (or CopyFileW). Returns False if unavailable or failed.
+
+    CopyFile2 is what shutil.copy2 itself uses on Python 3.12+; it streams
+    inside the kernel and can clone blocks on ReFS.
+    """
+    try:
+        import _winapi
+        _winapi.CopyFile2(str(src), str(dst), 0)
+        return True
+    except (ImportError, AttributeError):
+        pass  # Python < 3.12
+    except OSError:
+        return False
+    try:
+        import ctypes
+        return bool(ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False))
+    except (OSError, AttributeError):
+        return False
+
+
+def _copy_data(src, dst, size):
+    """Copy file contents using the cheapest kernel path this platform offers.
+
+    copy_file_range on Linux, CopyFileW on Windows; otherwise shutil.copyfile,
+    which uses fcopyfile on macOS and sendfile / a large-buffer loop elsewhere.
+    """
+    if _copy_range_supported and _copy_file_range(src, dst, size):
+        return
+    if IS_WINDOWS and _win_copy(src, dst):
+        return
+    shutil.copyfile(src, dst)
+
+
+def _copy_file(src, dst, st=None):
+    """Copy file data plus mode and timestamps, taking at most one stat of src.
+
+    Pass st when the caller already has it (e.g. from a scandir entry).
+    """
+    if st is None:
+        st = os.stat(src)
+    _copy_data(src, dst, st.st_size)
+    os.chmod(dst, st.st_mode)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+
+# ioctl request number for Linux FICLONE (btrfs, XFS with reflink, ...)
+FICLONE = 0x40049409
+
+# errnos meaning "this filesystem/device pair can't clone": once seen, later
+# files skip the attempt instead of paying for it on every small file
+CLONE_UNSUPPORTED_ERRNOS = {errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+_clone_supported = True
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+    import ctypes
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _reflink_or_copy(src, dst, *, follow_symlinks=True):
+    """Copy a file as a copy-on-write clone when the filesystem supports it.
+
+    Everything else goes through _copy_file and its kernel copy paths.
+    """
+    global _clone_supported
+    if IS_LINUX and _clone_supported:
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except ImportError:
+            _clone_supported = False
+        except OSError as e:
+            if e.errno in CLONE_UNSUPPORTED_ERRNOS:
+                _clone_supported = False
+    elif IS_MACOS and _clone_supported:
+        try:
+            import ctypes
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            if _libc().clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+            if ctypes.get_errno() in CLONE_UNSUPPORTED_ERRNOS:
+                _clone_supported = False
+        except (OSError, AttributeError):
+            _clone_supported = False
+    if follow_symlinks:
+        return _copy_file(src, dst)
+    return shutil.copy2(src, dst, follow_symlinks=False)
+
+
+def _plan_tree(src, dest):
+    """Create dest's directory layout from src and list the (src, dst) file pairs.
+
+    Doing all the mkdirs up front means copy workers never race on them.
+    Files and folders in dest that src no longer has are removed, so a
+    reinstall over an older version leaves nothing stale behind.
+    Bytecode caches are left behind: install_dependencies() compiles the
+    installed tree in one parallel compileall pass.
+    """
+    pairs = []
+    os.makedirs(dest, exist_ok=True)
+    for root, dirs, names in os.walk(src, followlinks=True):
+        if "__pycache__" in dirs:
+            dirs.remove("__pycache__")
+        target = os.path.normpath(os.path.join(dest, os.path.relpath(root, src)))
+        with os.scandir(target) as it:
+            existing = {entry.name: entry for entry in it}
+        existing.pop("__pycache__", None)
+
+        # The walk is top-down, so the parent already exists: a single
+        # mkdir is enough where makedirs would stat every ancestor first
+        for d in dirs:
+            old = existing.pop(d, None)
+            if old is not None:
+                if old.is_dir():
+                    continue
+                os.unlink(old.path)
+            os.mkdir(os.path.join(target, d))
+        names = [n for n in names if not n.endswith(".pyc")]
+        for n in names:
+            old = existing.pop(n, None)
+            if old is not None and old.is_dir(follow_symlinks=False):
+                shutil.rmtree(old.path)
+        pairs.extend((os.path.join(root, n), os.path.join(target, n)) for n in names)
+
+        for entry in existing.values():
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    return pairs
+
+
+def _unchanged(dst, st):
+    """True if dst exists with the same size and mtime as the stat result st."""
+    try:
+        dst_st = os.stat(dst)
+    except OSError:
+        return False
+    return dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns
+
+
+def _sync_tree(src, dest):
+    """Make dest mirror src, copying only files whose size or mtime differ.
+
+    Files and folders in dest that src doesn't have are removed.
+    """
+    os.makedirs(dest, exist_ok=True)
+    with os.scandir(dest) as it:
+        existing = {entry.name: entry for entry in it}
+
+    with os.scandir(src) as it:
+        for entry in it:
+            old = existing.pop(entry.name, None)
+            target = os.path.join(dest, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if old is not None and not old.is_dir(follow_symlinks=False):
+                    os.unlink(target)
+                _sync_tree(entry.path, target)
+                continue
+
+            st = entry.stat()
+            if old is not None:
+                if old.is_dir(follow_symlinks=False):
+                    shutil.rmtree(target)
+                else:
+                    old_st = old.stat(follow_symlinks=False)
+                    if old_st.st_size == st.st_size and old_st.st_mtime_ns == st.st_mtime_ns:
+                        continue
+            _copy_file(entry.path, target, st)
+
+    for entry in existing.values():
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
 def copy_files(src_dir, dest_dir):
     """Copy installation files."""
+    import concurrent.futures
     dirs_to_copy = ["core", "resolve", "tools", "cli", "ui", "schemas", "presets", "scripts", "sample_data", "docs"]
     files_to_copy = ["VERSION", "README.md", "LICENSE", "requirements.txt", "pyproject.toml"]
 
     dest_dir.mkdir(parents=True, exist_ok=True)
 
+    # One directory read tells us which items the source actually has; the
+    # entry types come from the same read, so no per-item stat is needed
+    src_dirs, src_files = set(), set()
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                src_dirs.add(entry.name)
+            elif entry.is_file():
+                src_files.add(entry.name)
+
+    # Walk every tree once, creating directories as we go, and collect the files
+    jobs = []
     for d in dirs_to_copy:
-        src = src_dir / d
-        if src.exists():
-            dest = dest_dir / d
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
-            print_success(f"Copied {d}/")
-
+        if d in src_dirs:
+            jobs.append((f"{d}/", _plan_tree(src_dir / d, dest_dir / d)))
     for f in files_to_copy:
-        src = src_dir / f
-        if src.exists():
-            shutil.copy2(src, dest_dir / f)
-            print_success(f"Copied {f}")
+        if f in src_files:
+            jobs.append((f, [(src_dir / f, dest_dir / f)]))
+
+    if sum(len(pairs) for _, pairs in jobs) < 32:
+        # Too few files to be worth a thread pool
+        for label, pairs in jobs:
+            for src, dst in pairs:
+                _reflink_or_copy(src, dst)
+            print_success(f"Copied {label}")
+    else:
+        # Copies are I/O bound and independent, so overlap them on a thread pool
+        # (the kernel copy calls release the GIL)
+        remaining = {label: len(pairs) for label, pairs in jobs}
+        for label, count in remaining.items():
+            if not count:
+                print_success(f"Copied {label}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            futures = {ex.submit(_reflink_or_copy, src, dst): label
+                       for label, pairs in jobs for src, dst in pairs}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    # Fail fast: drop the copies that haven't started yet
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    raise
+                label = futures[future]
+                remaining[label] -= 1
+                if not remaining[label]:
+                    print_success(f"Copied {label}")
 
 
 def create_venv(install_dir):
@@ -506,12 +1204,34 @@ def create_venv(install_dir):
 
     if venv_dir.exists():
         if prompt("Virtual environment exists. Recreate?", "n"):
-            shutil.rmtree(venv_dir)
+            # Trash goes beside install_dir, not inside it where
+            # compileall would walk it
+            remove_tree_later(venv_dir, install_dir.parent)
         else:
             return venv_dir
 
     print_step("Creating virtual environment...")
-    subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+    uv = shutil.which("uv")
+    if uv:
+        # uv links the interpreter and seeds pip from its wheel cache instead
+        # of running ensurepip; install_dependencies() also prefers uv
+        import subprocess
+        cmd = [uv, "venv", "-q", "--seed", str(venv_dir)]
+        if not getattr(sys, 'frozen', False):
+            cmd[2:2] = ["--python", sys.executable]
+        try:
+            subprocess.run(cmd, check=True, creationflags=SUBPROCESS_FLAGS)
+            print_success("Virtual environment created")
+            return venv_dir
+        except (OSError, subprocess.CalledProcessError):
+            print_warning("uv could not create the environment, using venv instead")
+
+    # Build the venv in-process rather than starting another interpreter for
+    # "python -m venv". pip/setuptools/wheel are upgraded by the single pip run
+    # in install_dependencies(), so upgrade_deps would only add a pip call.
+    # Like the venv CLI, link the interpreter on POSIX instead of copying it.
+    import venv
+    venv.EnvBuilder(with_pip=True, clear=True, symlinks=not IS_WINDOWS).create(str(venv_dir))
     print_success("Virtual environment created")
 
     return venv_dir
@@ -533,20 +1253,56 @@ def get_python(venv_dir):
 
 def install_dependencies(venv_dir, install_dir, install_ui=True):
     """Install Python dependencies."""
+    import subprocess
     python = get_python(venv_dir)
 
-    # Use python -m pip instead of pip directly (fixes Windows upgrade issue)
-    print_step("Upgrading pip...")
-    subprocess.run([str(python), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel", "-q"], check=True)
+    # Use python -m pip instead of pip directly (fixes Windows upgrade issue).
+    # Skip pip's own PyPI version check and never stop to ask for input.
+    pip_install = [str(python), "-m", "pip", "install", "-q", "--no-compile",
+                   "--disable-pip-version-check", "--no-input"]
+    # No --upgrade here: it would apply to every package in the combined run
+    # and pull the newest of each dependency. The version floor alone makes
+    # pip replace an older copy of itself.
+    tooling = ["pip>=24.3", "setuptools", "wheel"]
 
-    print_step("Installing dependencies...")
+    packages = []
     req_file = install_dir / "requirements.txt"
     if req_file.exists():
-        subprocess.run([str(python), "-m", "pip", "install", "-r", str(req_file), "-q"], check=True)
-
-    print_step("Installing package...")
+        packages += ["-r", str(req_file)]
     extras = "[ui]" if install_ui else ""
-    subprocess.run([str(python), "-m", "pip", "install", "-e", f"{install_dir}{extras}", "-q"], check=True)
+    packages += ["-e", f"{install_dir}{extras}"]
+
+    installed = False
+    uv = shutil.which("uv")
+    if uv:
+        # uv resolves and downloads in parallel and doesn't need pip upgraded first
+        print_step("Installing dependencies and package with uv...")
+        try:
+            subprocess.run([uv, "pip", "install", "-q", "--python", str(python)] + packages,
+                           check=True, creationflags=SUBPROCESS_FLAGS)
+            installed = True
+        except (OSError, subprocess.CalledProcessError):
+            # uv doesn't read pip.conf or PIP_INDEX_URL, so a mirror or proxy
+            # set up for pip may only work through pip
+            print_warning("uv could not install the dependencies, using pip instead")
+
+    if not installed:
+        # One pip run resolves and installs everything, paying pip's startup once
+        print_step("Installing pip, dependencies and package...")
+        try:
+            subprocess.run(pip_install + tooling + packages, check=True, creationflags=SUBPROCESS_FLAGS)
+        except subprocess.CalledProcessError:
+            # The venv's bundled pip can be too old for the combined request;
+            # upgrade it on its own, then retry the rest
+            print_warning("Combined install failed, upgrading pip first...")
+            subprocess.run(pip_install + ["--upgrade"] + tooling, check=True, creationflags=SUBPROCESS_FLAGS)
+            subprocess.run(pip_install + packages, check=True, creationflags=SUBPROCESS_FLAGS)
+
+    # pip was told not to byte-compile; do it once for the whole install
+    # (venv included) across all CPU cores
+    print_step("Compiling Python files...")
+    subprocess.run([str(python), "-m", "compileall", "-j", "0", "-q", str(install_dir)],
+                   creationflags=SUBPROCESS_FLAGS)
 
     print_success("Dependencies installed")
 
@@ -629,23 +1385,123 @@ def add_to_path(install_dir):
     if not prompt("Add to system PATH?"):
         return
 
-    import winreg
+    install_str = str(install_dir)
+
+    def add(entries):
+        if _path_key(install_str) not in {_path_key(p) for p in entries}:
+            entries.append(install_str)
+
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Environment", 0, winreg.KEY_ALL_ACCESS) as key:
-            try:
-                path_value, _ = winreg.QueryValueEx(key, "Path")
-            except WindowsError:
-                path_value = ""
-
-            install_str = str(install_dir)
-            if install_str not in path_value:
-                new_path = f"{path_value};{install_str}" if path_value else install_str
-                winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                print_success("Added to PATH")
+        if _update_user_path(add):
+            print_success("Added to PATH")
     except Exception as e:
         print_warning(f"Could not update PATH: {e}")
 
 
+@functools.lru_cache(maxsize=None)
+def _path_key(entry):
+    """Normalised form of a PATH entry, for comparing whole entries."""
+    return winreg.ExpandEnvironmentStrings(entry).rstrip("\\").lower()
+
+
+def _update_user_path(mutate):
+    """Edit the user's PATH in HKCU\\Environment with one key open.
+
+    mutate(entries) changes the list of PATH entries in place. The value is
+    written back (and the change broadcast) only if the list changed.
+    Returns True if PATH was rewritten.
+    """
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Environment", 0,
+                        winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE) as key:
+        try:
+            path_value, value_type = winreg.QueryValueEx(key, "Path")
+        except FileNotFoundError:
+            path_value, value_type = "", winreg.REG_EXPAND_SZ
+
+        entries = [p for p in path_value.split(";") if p]
+        original = list(entries)
+        mutate(entries)
+        if entries == original:
+            return False
+
+        winreg.SetValueEx(key, "Path", 0, value_type, ";".join(entries))
+    _broadcast_environment_change()
+    return True
+
+
+def _broadcast_environment_change():
+    """Tell running programs (Explorer, new shells) that the user environment changed."""
+    try:
+        import ctypes
+        result = ctypes.c_size_t()
+        ctypes.windll.user32.SendMessageTimeoutW(
+            0xFFFF, 0x001A, 0, "Environment",  # HWND_BROADCAST, WM_SETTINGCHANGE
+            0x0002, 5000, ctypes.byref(result))  # SMTO_ABORTIFHUNG, 5 s
+    except (OSError, AttributeError):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_desktop_dir():
+    """The user's Desktop folder, or None if there isn't one."""
+    desktop = Path.home() / "Desktop"
+    return desktop if desktop.is_dir() else None
+
+
+# COM identifiers for writing .lnk files through IShellLinkW / IPersistFile
+CLSID_SHELL_LINK = "{00021401-0000-0000-C000-000000000046}"
+IID_ISHELL_LINK_W = "{000214F9-0000-0000-C000-000000000046}"
+IID_IPERSIST_FILE = "{0000010B-0000-0000-C000-000000000046}"
+
+
+def _create_windows_shortcut(shortcut_path, target, working_dir, description):
+    """Write a Windows .lnk in-process via the ShellLink COM object.
+
+    Avoids starting PowerShell (and .NET) just to make one shortcut.
+    Raises OSError if any COM call fails.
+    """
+    import ctypes
+
+    class GUID(ctypes.Structure):
+        _fields_ = [("Data1", ctypes.c_uint32), ("Data2", ctypes.c_uint16),
+                    ("Data3", ctypes.c_uint16), ("Data4", ctypes.c_ubyte * 8)]
+
+    def guid(text):
+        g = GUID()
+        ctypes.oledll.ole32.CLSIDFromString(text, ctypes.byref(g))
+        return g
+
+    def com_method(obj, index, *argtypes, restype=ctypes.HRESULT):
+        vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+        return ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)(vtable[index])
+
+    # Vtable slots: IUnknown 0-2, IShellLinkW SetDescription 7,
+    # SetWorkingDirectory 9, SetPath 20; IPersistFile Save 6
+    initialized = ctypes.windll.ole32.CoInitialize(None) >= 0
+    try:
+        link = ctypes.c_void_p()
+        ctypes.oledll.ole32.CoCreateInstance(
+            ctypes.byref(guid(CLSID_SHELL_LINK)), None, 1,  # CLSCTX_INPROC_SERVER
+            ctypes.byref(guid(IID_ISHELL_LINK_W)), ctypes.byref(link))
+        try:
+            com_method(link, 20, ctypes.c_wchar_p)(link, str(target))
+            com_method(link, 9, ctypes.c_wchar_p)(link, str(working_dir))
+            com_method(link, 7, ctypes.c_wchar_p)(link, description)
+
+            persist = ctypes.c_void_p()
+            com_method(link, 0, ctypes.c_void_p, ctypes.c_void_p)(
+                link, ctypes.byref(guid(IID_IPERSIST_FILE)), ctypes.byref(persist))
+            try:
+                com_method(persist, 6, ctypes.c_wchar_p, ctypes.c_int)(persist, str(shortcut_path), 1)
+            finally:
+                com_method(persist, 2, restype=ctypes.c_ulong)(persist)
+        finally:
+            com_method(link, 2, restype=ctypes.c_ulong)(link)
+    finally:
+        if initialized:
+            ctypes.windll.ole32.CoUninitialize()
+
+
 def create_desktop_shortcut_impl(install_dir, silent=False):
     """Create desktop shortcut (implementation).
 
@@ -656,16 +1512,18 @@ def create_desktop_shortcut_impl(install_dir, silent=False):
     Returns:
         True if shortcut was created, False otherwise
     """
-    desktop = Path.home() / "Desktop"
-    if not desktop.exists():
-        desktop = Path.home()
+    import subprocess
+    desktop = get_desktop_dir() or Path.home()
 
     if IS_WINDOWS:
         try:
-            # Use PowerShell to create shortcut
-            shortcut_path = desktop / "Resolve Production Suite.lnk"
+            shortcut_path = desktop / SHORTCUT_NAME
             target = install_dir / "resolve-suite-ui.bat"
-            ps_cmd = f'''
+            try:
+                _create_windows_shortcut(shortcut_path, target, install_dir, "Resolve Production Suite")
+            except (OSError, AttributeError):
+                # Fall back to PowerShell if the COM call isn't available
+                ps_cmd = f'''
 $ws = New-Object -ComObject WScript.Shell
 $s = $ws.CreateShortcut("{shortcut_path}")
 $s.TargetPath = "{target}"
@@ -673,7 +1531,10 @@ $s.WorkingDirectory = "{install_dir}"
 $s.Description = "Resolve Production Suite"
 $s.Save()
 '''
-            subprocess.run(["powershell", "-Command", ps_cmd], check=True, capture_output=True)
+                # Only stderr is worth keeping (it lands on CalledProcessError)
+                subprocess.run(["powershell", "-Command", ps_cmd], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               creationflags=SUBPROCESS_FLAGS)
             if not silent:
                 print_success("Created desktop shortcut")
             return True
@@ -685,7 +1546,7 @@ $s.Save()
     elif IS_MACOS:
         try:
             # Create macOS shortcut with .command extension so it's double-clickable in Finder
-            shortcut_path = desktop / "Resolve Production Suite.command"
+            shortcut_path = desktop / SHORTCUT_NAME
             target = install_dir / "resolve-suite-ui"
 
             # Create a shell script wrapper that users can double-click
@@ -706,7 +1567,7 @@ cd "{install_dir}"
 
     elif IS_LINUX:
         try:
-            shortcut = desktop / "resolve-production-suite.desktop"
+            shortcut = desktop / SHORTCUT_NAME
             shortcut.write_text(f"""[Desktop Entry]
 Version=1.0
 Type=Application
@@ -736,21 +1597,12 @@ def create_desktop_shortcut(install_dir):
 
 def ensure_desktop_shortcut(install_dir):
     """Ensure desktop shortcut exists (creates if missing, silent)."""
-    desktop = Path.home() / "Desktop"
-    if not desktop.exists():
+    desktop = get_desktop_dir()
+    if desktop is None or SHORTCUT_NAME is None:
         return
 
     # Check if shortcut already exists
-    if IS_WINDOWS:
-        shortcut_path = desktop / "Resolve Production Suite.lnk"
-    elif IS_MACOS:
-        shortcut_path = desktop / "Resolve Production Suite.command"
-    elif IS_LINUX:
-        shortcut_path = desktop / "resolve-production-suite.desktop"
-    else:
-        return
-
-    if not shortcut_path.exists():
+    if not os.path.lexists(desktop / SHORTCUT_NAME):
         print_step("Creating desktop shortcut...")
         if create_desktop_shortcut_impl(install_dir, silent=True):
             print_success("Desktop shortcut created")
@@ -760,13 +1612,21 @@ def ensure_desktop_shortcut(install_dir):
 # Main Installation Flow
 # =============================================================================
 
-def run_installation():
-    """Run the installation process."""
+def run_installation(resolve_future=None):
+    """Run the installation process.
+
+    resolve_future, if given, is a detect_resolve() call already running in
+    the background (see main()).
+    """
+    import subprocess
+    if resolve_future is None:
+        resolve_future = _run_in_background(detect_resolve)
     print_header()
     print("INSTALLATION\n")
 
     # Use default install directory (simpler)
     install_dir = get_install_path()
+    sweep_trash(install_dir.parent)
     print(f"  Install location: {install_dir}")
     print(f"  Data directory:   {get_data_dir()}")
     print()
@@ -776,7 +1636,7 @@ def run_installation():
     print_success("Will install Desktop UI (recommended)")
 
     # Auto-detect Resolve
-    resolve_path = detect_resolve()
+    resolve_path = resolve_future.result()
     if resolve_path:
         print_success(f"Detected Resolve: {resolve_path}")
     else:
@@ -805,6 +1665,7 @@ def run_installation():
         progress("Copying files...")
         try:
             copy_files(INSTALL_SOURCE, install_dir)
+            is_installed.cache_clear()
         except PermissionError as e:
             print_error("Permission denied while copying files.")
             print("\nTry one of these:")
@@ -859,24 +1720,26 @@ def run_installation():
         create_desktop_shortcut_impl(install_dir, silent=False)
 
         # Success
-        print()
-        print("=" * 55)
-        print(f"{Colors.GREEN}  INSTALLATION COMPLETE!{Colors.END}")
-        print("=" * 55)
-        print()
-        print(f"  {Colors.CYAN}GET STARTED:{Colors.END}")
-        print()
-        print("    1. Open DaVinci Resolve")
-        print("    2. Double-click 'Resolve Production Suite' on your Desktop")
-        print("    3. Click 'Connect' to connect to Resolve")
-        print("    4. Select a tool and run it!")
-        print()
-        print(f"  {Colors.CYAN}SHORTCUT MISSING?{Colors.END}")
-        print("    Run this installer again and choose 'Create Desktop Shortcut'")
-        print()
-        print(f"  {Colors.CYAN}DOCUMENTATION:{Colors.END}")
-        print(f"    {install_dir / 'docs'}")
-        print()
+        print_block([
+            "",
+            "=" * 55,
+            f"{Colors.GREEN}  INSTALLATION COMPLETE!{Colors.END}",
+            "=" * 55,
+            "",
+            f"  {Colors.CYAN}GET STARTED:{Colors.END}",
+            "",
+            "    1. Open DaVinci Resolve",
+            "    2. Double-click 'Resolve Production Suite' on your Desktop",
+            "    3. Click 'Connect' to connect to Resolve",
+            "    4. Select a tool and run it!",
+            "",
+            f"  {Colors.CYAN}SHORTCUT MISSING?{Colors.END}",
+            "    Run this installer again and choose 'Create Desktop Shortcut'",
+            "",
+            f"  {Colors.CYAN}DOCUMENTATION:{Colors.END}",
+            f"    {install_dir / 'docs'}",
+            "",
+        ])
 
     except KeyboardInterrupt:
         print("\n\nInstallation cancelled.")
@@ -889,7 +1752,6 @@ def run_installation():
         print("  https://github.com/contactmukundthiru-cyber/davinci-suite-scripts/issues")
         print()
         print("Include the error message above when reporting.")
-        import traceback
         traceback.print_exc()
         wait_for_key()
         return
@@ -901,16 +1763,67 @@ def run_installation():
 # Uninstall
 # =============================================================================
 
+def _unlink(path):
+    """Remove a file, clearing the read-only attribute Windows may refuse it for."""
+    try:
+        os.unlink(path)
+    except PermissionError:
+        os.chmod(path, 0o666)
+        os.unlink(path)
+
+
+def _fast_rmtree(root):
+    """Delete a directory tree, unlinking its files on a thread pool.
+
+    One scandir pass (no per-entry stat) collects the directories and queues
+    the files; once every file is gone the directories are removed deepest
+    first. Symlinked directories are unlinked, never followed.
+    """
+    import concurrent.futures
+    dirs = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as ex:
+        futures = []
+        stack = [os.fspath(root)]
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if _is_link(entry):
+                        # Directory symlinks/junctions on Windows need rmdir
+                        if IS_WINDOWS and entry.is_dir():
+                            futures.append(ex.submit(os.rmdir, entry.path))
+                        else:
+                            futures.append(ex.submit(_unlink, entry.path))
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        futures.append(ex.submit(_unlink, entry.path))
+        for future in futures:
+            future.result()
+
+    # Children were always found after their parents
+    for d in reversed(dirs):
+        os.rmdir(d)
+
+
+def _is_link(entry):
+    """True for symlinks and, on Windows, junctions and other reparse points."""
+    if entry.is_symlink():
+        return True
+    if IS_WINDOWS:
+        # FILE_ATTRIBUTE_REPARSE_POINT; DirEntry caches this stat on Windows
+        return bool(entry.stat(follow_symlinks=False).st_file_attributes & 0x400)
+    return False
+
+
 def run_uninstall():
     """Uninstall Resolve Production Suite."""
     print_header()
     print("UNINSTALL\n")
 
     # Find installation directory
-    if IS_WINDOWS:
-        install_dir = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
-    else:
-        install_dir = Path.home() / ".local" / "share" / "resolve-production-suite"
+    install_dir = get_install_path()
 
     data_dir = get_data_dir()
 
@@ -937,50 +1850,37 @@ def run_uninstall():
 
     try:
         # Remove desktop shortcut
-        desktop = Path.home() / "Desktop"
-        if IS_WINDOWS:
-            shortcut = desktop / "Resolve Production Suite.lnk"
-            if shortcut.exists():
-                shortcut.unlink()
-                print_success("Removed desktop shortcut")
-        elif IS_MACOS:
-            shortcut = desktop / "Resolve Production Suite.command"
-            if shortcut.exists():
-                shortcut.unlink()
-                print_success("Removed desktop shortcut")
-        elif IS_LINUX:
-            shortcut = desktop / "resolve-production-suite.desktop"
-            if shortcut.exists():
-                shortcut.unlink()
+        desktop = get_desktop_dir()
+        if desktop is not None and SHORTCUT_NAME is not None:
+            # Just try the unlink; a missing shortcut costs no extra stat
+            try:
+                (desktop / SHORTCUT_NAME).unlink()
                 print_success("Removed desktop shortcut")
+            except FileNotFoundError:
+                pass
 
         # Remove from PATH on Windows
         if IS_WINDOWS:
+            install_key = _path_key(str(install_dir))
+
+            def remove(entries):
+                entries[:] = [p for p in entries if _path_key(p) != install_key]
+
             try:
-                import winreg
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Environment", 0, winreg.KEY_ALL_ACCESS) as key:
-                    try:
-                        path_value, _ = winreg.QueryValueEx(key, "Path")
-                        install_str = str(install_dir)
-                        if install_str in path_value:
-                            # Remove our path
-                            paths = [p for p in path_value.split(";") if p and p != install_str]
-                            new_path = ";".join(paths)
-                            winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                            print_success("Removed from PATH")
-                    except WindowsError:
-                        pass
+                if _update_user_path(remove):
+                    print_success("Removed from PATH")
             except Exception:
                 pass
 
         # Remove installation directory
         if install_dir.exists():
-            shutil.rmtree(install_dir)
+            _fast_rmtree(install_dir)
+            is_installed.cache_clear()
             print_success(f"Removed: {install_dir}")
 
         # Remove data directory if requested
         if remove_data and data_dir.exists():
-            shutil.rmtree(data_dir)
+            _fast_rmtree(data_dir)
             print_success(f"Removed: {data_dir}")
 
         print()
@@ -989,27 +1889,24 @@ def run_uninstall():
 
     except Exception as e:
         print_error(f"Uninstall failed: {e}")
-        import traceback
         traceback.print_exc()
 
     wait_for_key()
 
 
+@functools.lru_cache(maxsize=1)
 def is_installed():
-    """Check if the suite is already installed."""
-    if IS_WINDOWS:
-        install_dir = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
-    else:
-        install_dir = Path.home() / ".local" / "share" / "resolve-production-suite"
-    return install_dir.exists()
+    """Check if the suite is already installed.
+
+    Cached; run_installation() and run_uninstall() clear it when they
+    create or remove the install directory.
+    """
+    return os.path.isdir(get_install_path())
 
 
 def get_install_path():
     """Get the default installation path."""
-    if IS_WINDOWS:
-        return Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ResolveProductionSuite"
-    else:
-        return Path.home() / ".local" / "share" / "resolve-production-suite"
+    return DEFAULT_INSTALL_DIR
 
 
 def run_create_shortcut():
@@ -1048,6 +1945,9 @@ def run_create_shortcut():
 
 def main():
     """Main entry point with menu."""
+    # Probe the filesystem while the banner and menu are on screen
+    installed_future = _run_in_background(is_installed)
+    resolve_future = _run_in_background(detect_resolve)
     print_header()
 
     # Check Python version
@@ -1068,7 +1968,7 @@ def main():
 
     print_success(f"Python {sys.version_info.major}.{sys.version_info.minor} detected")
 
-    already_installed = is_installed()
+    already_installed = installed_future.result()
 
     print("""
     RESOLVE PRODUCTION SUITE
@@ -1083,26 +1983,23 @@ def main():
 """)
 
     while True:
-        print("\nWhat would you like to do?\n")
-        if already_installed:
-            print("  1. Reinstall / Repair")
-            print("  2. Check for Updates")
-            print("  3. Create Desktop Shortcut")
-            print("  4. Uninstall")
-            print("  5. Exit")
-        else:
-            print("  1. Install (First Time Setup)")
-            print("  2. Check for Updates")
-            print("  3. Create Desktop Shortcut")
-            print("  4. Uninstall")
-            print("  5. Exit")
-        print()
+        print_block([
+            "",
+            "What would you like to do?",
+            "",
+            "  1. Reinstall / Repair" if already_installed else "  1. Install (First Time Setup)",
+            "  2. Check for Updates",
+            "  3. Create Desktop Shortcut",
+            "  4. Uninstall",
+            "  5. Exit",
+            "",
+        ])
 
         try:
             choice = input("Enter choice (1-5): ").strip()
 
             if choice == "1":
-                run_installation()
+                run_installation(resolve_future)
                 break
             elif choice == "2":
                 run_updater()
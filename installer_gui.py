@@ -12,11 +12,16 @@ On Windows, double-click this file or run:
     pythonw installer_gui.py
 """
 
+import functools
+import json
 import os
 import platform
+import queue
+import string
 import subprocess
 import sys
 import threading
+import time
 from pathlib import Path
 
 # Tkinter import with fallback
@@ -36,14 +41,231 @@ except ImportError:
 # =============================================================================
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
-VERSION = (SCRIPT_DIR / "VERSION").read_text().strip() if (SCRIPT_DIR / "VERSION").exists() else "0.2.0"
 VENV_DIR = SCRIPT_DIR / ".venv"
 MIN_PYTHON = (3, 9)
+RPS_HOME = Path.home() / ".rps"
+WINDOW_WIDTH, WINDOW_HEIGHT = 600, 500
+
+# Resolve detection results (hits and misses) are reused for a day
+DETECT_CACHE_FILE = RPS_HOME / "detect_cache.json"
+DETECT_CACHE_TTL = 24 * 60 * 60
+
+
+@functools.lru_cache(maxsize=None)
+def get_version():
+    """Version from the VERSION file, read once on first use (one open, no stat)."""
+    try:
+        with open(SCRIPT_DIR / "VERSION", "rb") as f:
+            return f.read().decode().strip()
+    except FileNotFoundError:
+        return "0.2.0"
+
+
+# How often (ms) the Tk thread applies updates queued by the install thread
+UI_POLL_MS = 30
+
+# Only the newest lines are kept in the log widget; Text inserts slow down
+# as the widget grows
+LOG_MAX_LINES = 500
+
+# A venv whose bundled pip is at least this new is used as-is; older ones are
+# upgraded as part of the install (pip 21.3+ is needed for pyproject editables)
+PIP_MIN_VERSION = (23, 0)
+
+
+def venv_pip_version(venv_dir: Path) -> tuple:
+    """(major, minor) of the pip installed in venv_dir, or () if not found.
+
+    Read from the name of pip's dist-info folder, so no interpreter is started.
+    """
+    for pattern in ("Lib/site-packages/pip-*.dist-info",
+                    "lib/python*/site-packages/pip-*.dist-info"):
+        for info in venv_dir.glob(pattern):
+            version = info.name[len("pip-"):-len(".dist-info")]
+            parts = version.split(".")[:2]
+            if all(p.isdigit() for p in parts):
+                return tuple(int(p) for p in parts)
+    return ()
+
+
+# Child process output is read in chunks of this size rather than line by line
+PIPE_READ_SIZE = 128 * 1024
+
+
+def run_streaming(cmd, on_line):
+    """Run cmd, passing each line of its combined stdout/stderr to on_line.
+
+    Output is pulled with large os.read() calls and split into lines here,
+    instead of one readline() round trip per line. Returns the exit code.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    fd = proc.stdout.fileno()
+    pending = b""
+    while True:
+        chunk = os.read(fd, PIPE_READ_SIZE)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            on_line(line.decode(errors="replace").rstrip("\r"))
+    if pending:
+        on_line(pending.decode(errors="replace").rstrip("\r"))
+    proc.stdout.close()
+    return proc.wait()
+
 
 # Platform detection
-IS_WINDOWS = platform.system() == "Windows"
-IS_MACOS = platform.system() == "Darwin"
-IS_LINUX = platform.system() == "Linux"
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"
+IS_MACOS = SYSTEM == "Darwin"
+IS_LINUX = SYSTEM == "Linux"
+
+# Where Resolve's scripting modules live on each platform
+RESOLVE_CANDIDATE_PATHS = {
+    "Linux": (
+        "/opt/resolve/Developer/Scripting/Modules",
+        "/opt/blackmagic/DaVinci Resolve/Developer/Scripting/Modules",
+    ),
+    "Darwin": (
+        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+    ),
+    "Windows": (
+        r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting\Modules",
+        r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Developer\Scripting\Modules",
+    ),
+}.get(SYSTEM, ())
+
+
+# Detection results are only reused for the same platform and candidate list
+DETECT_CACHE_KEY = "|".join((SYSTEM,) + RESOLVE_CANDIDATE_PATHS)
+
+
+def _load_detect_cache() -> dict:
+    try:
+        with open(DETECT_CACHE_FILE, "rb") as f:
+            cache = json.loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_detect_cache(cache: dict):
+    try:
+        RPS_HOME.mkdir(parents=True, exist_ok=True)
+        DETECT_CACHE_FILE.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def detect_resolve() -> str:
+    """Auto-detect Resolve scripting path.
+
+    Probed once per session. The result of the candidate scan, found or not,
+    is also kept in DETECT_CACHE_FILE so re-running the installer skips it.
+    """
+    # Check environment variable
+    env_path = os.environ.get("RESOLVE_SCRIPT_API", "")
+    if env_path and os.path.isdir(env_path):
+        return env_path
+
+    cache = _load_detect_cache()
+    entry = cache.get(DETECT_CACHE_KEY)
+    if isinstance(entry, dict) and time.time() - entry.get("checked", 0) < DETECT_CACHE_TTL:
+        return entry.get("path", "")
+
+    # Check common paths
+    found = ""
+    for p in RESOLVE_CANDIDATE_PATHS:
+        if os.path.isdir(p):
+            found = p
+            break
+
+    cache[DETECT_CACHE_KEY] = {"path": found, "checked": time.time()}
+    _save_detect_cache(cache)
+    return found
+
+
+def forget_detected_resolve():
+    """Drop cached detection results, e.g. once the user picks a path by hand."""
+    detect_resolve.cache_clear()
+    cache = _load_detect_cache()
+    if cache.pop(DETECT_CACHE_KEY, None) is not None:
+        _save_detect_cache(cache)
+
+
+# =============================================================================
+# Page Text
+# =============================================================================
+
+TOOLS = (
+    "1. Revision Resolver - Asset swap across timelines",
+    "2. Relink Across Projects - Brand kit rollout",
+    "3. Smart Reframer - Constraint-based reframing",
+    "4. Caption Layout Protector - Safe zone protection",
+    "5. Feedback Compiler - Notes to markers",
+    "6. Timeline Normalizer - Handoff preparation",
+    "7. Component Graphics - Graphics registry",
+    "8. Delivery Spec Enforcer - Output validation",
+    "9. Change Impact Analyzer - Timeline diff",
+    "10. Brand Drift Detector - Brand audit",
+)
+
+# Lines indented by two spaces are commands and are shown in a monospace font
+QUICK_START_COMMANDS = (
+    "",
+    "List all tools:",
+    "  resolve-suite list",
+    "",
+    "Run a tool:",
+    "  resolve-suite run t1_revision_resolver --dry-run",
+    "",
+    "Check for updates:",
+    "  resolve-suite update",
+)
+
+UI_LAUNCH_COMMANDS = (
+    "",
+    "Launch Desktop UI:",
+    "  resolve-suite-ui",
+)
+
+
+# =============================================================================
+# Launcher Templates
+# =============================================================================
+
+CLI_BAT_TEMPLATE = string.Template("""@echo off
+call "$scripts\\activate.bat"
+python -m cli.main %*
+""")
+
+UI_BAT_TEMPLATE = string.Template("""@echo off
+call "$scripts\\activate.bat"
+pythonw -m ui.app %*
+""")
+
+CLI_SH_TEMPLATE = string.Template("""#!/usr/bin/env bash
+source "$bin/activate"
+python -m cli.main "$$@"
+""")
+
+UI_SH_TEMPLATE = string.Template("""#!/usr/bin/env bash
+source "$bin/activate"
+python -m ui.app "$$@"
+""")
+
+ENV_BAT_TEMPLATE = string.Template("""@echo off
+set RPS_HOME=%USERPROFILE%\\.rps
+set RESOLVE_SCRIPT_API=$resolve
+set PATH=%PATH%;$venv\\Scripts
+""")
+
+ENV_SH_TEMPLATE = string.Template("""#!/usr/bin/env bash
+export RPS_HOME="$$HOME/.rps"
+export RESOLVE_SCRIPT_API="$resolve"
+export PATH="$$PATH:$venv/bin"
+""")
 
 
 # =============================================================================
@@ -53,8 +275,8 @@ IS_LINUX = platform.system() == "Linux"
 class InstallerApp:
     def __init__(self, root):
         self.root = root
-        self.root.title(f"Resolve Production Suite v{VERSION} - Installer")
-        self.root.geometry("600x500")
+        self.root.title(f"Resolve Production Suite v{get_version()} - Installer")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.resizable(False, False)
 
         # Center window
@@ -64,59 +286,32 @@ class InstallerApp:
         self.install_ui = tk.BooleanVar(value=True)
         self.install_analysis = tk.BooleanVar(value=False)
         self.dev_mode = tk.BooleanVar(value=False)
-        self.resolve_path = tk.StringVar(value=self.detect_resolve())
+        self.resolve_path = tk.StringVar(value=detect_resolve())
         self.install_dir = tk.StringVar(value=str(SCRIPT_DIR))
 
-        # Create pages
+        # Pages are built the first time they are shown
         self.pages = {}
         self.current_page = 0
-
-        self.create_welcome_page()
-        self.create_options_page()
-        self.create_resolve_page()
-        self.create_install_page()
-        self.create_complete_page()
+        self._page_factories = {
+            0: self.create_welcome_page,
+            1: self.create_options_page,
+            2: self.create_resolve_page,
+            3: self.create_install_page,
+            4: self.create_complete_page,
+        }
 
         self.show_page(0)
 
+        # Tk is not thread-safe: the install thread only queues UI updates,
+        # and the Tk thread applies them (log lines in batches)
+        self._ui_queue = queue.Queue()
+        self.root.after(UI_POLL_MS, self._pump_ui)
+
     def center_window(self):
-        self.root.update_idletasks()
-        w = self.root.winfo_width()
-        h = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (300)
-        y = (self.root.winfo_screenheight() // 2) - (250)
-        self.root.geometry(f"600x500+{x}+{y}")
-
-    def detect_resolve(self) -> str:
-        """Auto-detect Resolve scripting path."""
-        paths = []
-
-        if IS_LINUX:
-            paths = [
-                "/opt/resolve/Developer/Scripting/Modules",
-                "/opt/blackmagic/DaVinci Resolve/Developer/Scripting/Modules"
-            ]
-        elif IS_MACOS:
-            paths = [
-                "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"
-            ]
-        elif IS_WINDOWS:
-            paths = [
-                r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting\Modules",
-                r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Developer\Scripting\Modules"
-            ]
-
-        # Check environment variable
-        env_path = os.environ.get("RESOLVE_SCRIPT_API", "")
-        if env_path and Path(env_path).exists():
-            return env_path
-
-        # Check common paths
-        for p in paths:
-            if Path(p).exists():
-                return p
-
-        return ""
+        # The window size is fixed, so no layout pass is needed to measure it
+        x = (self.root.winfo_screenwidth() // 2) - (WINDOW_WIDTH // 2)
+        y = (self.root.winfo_screenheight() // 2) - (WINDOW_HEIGHT // 2)
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
 
     def create_header(self, parent, title, subtitle=""):
         """Create a consistent header for each page."""
@@ -126,15 +321,14 @@ class InstallerApp:
         ttk.Label(
             header,
             text=title,
-            font=("Helvetica", 16, "bold")
+            style="Header.TLabel"
         ).pack(anchor="w")
 
         if subtitle:
             ttk.Label(
                 header,
                 text=subtitle,
-                font=("Helvetica", 10),
-                foreground="gray"
+                style="Subtitle.TLabel"
             ).pack(anchor="w", pady=(5, 0))
 
         ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=20, pady=10)
@@ -174,7 +368,7 @@ class InstallerApp:
         self.create_header(
             page,
             "Welcome to Resolve Production Suite",
-            f"Version {VERSION} - Workflow Automation for DaVinci Resolve"
+            f"Version {get_version()} - Workflow Automation for DaVinci Resolve"
         )
 
         content = ttk.Frame(page)
@@ -189,32 +383,31 @@ class InstallerApp:
         ttk.Label(
             content,
             text="The suite includes 10 workflow automation tools:",
-            font=("Helvetica", 10, "bold")
+            style="Bold.TLabel"
         ).pack(anchor="w")
 
-        tools = [
-            "1. Revision Resolver - Asset swap across timelines",
-            "2. Relink Across Projects - Brand kit rollout",
-            "3. Smart Reframer - Constraint-based reframing",
-            "4. Caption Layout Protector - Safe zone protection",
-            "5. Feedback Compiler - Notes to markers",
-            "6. Timeline Normalizer - Handoff preparation",
-            "7. Component Graphics - Graphics registry",
-            "8. Delivery Spec Enforcer - Output validation",
-            "9. Change Impact Analyzer - Timeline diff",
-            "10. Brand Drift Detector - Brand audit"
-        ]
-
-        tools_frame = ttk.Frame(content)
-        tools_frame.pack(fill="x", pady=10)
-
-        for tool in tools:
-            ttk.Label(tools_frame, text=tool, font=("Helvetica", 9)).pack(anchor="w")
+        # One read-only Text for the whole list instead of a Label per tool,
+        # styled to blend in with the page like the labels around it
+        style = ttk.Style()
+        tools_text = tk.Text(
+            content,
+            height=len(TOOLS),
+            width=60,
+            font=style.lookup("Small.TLabel", "font") or ("Helvetica", 9),
+            background=style.lookup("TFrame", "background") or self.root.cget("background"),
+            borderwidth=0,
+            highlightthickness=0,
+            cursor="",
+            wrap="none"
+        )
+        tools_text.insert("1.0", "\n".join(TOOLS))
+        tools_text.config(state="disabled")
+        tools_text.pack(anchor="w", pady=10)
 
         ttk.Label(
             content,
             text="Click Next to continue.",
-            font=("Helvetica", 10)
+            style="Body.TLabel"
         ).pack(anchor="w", pady=(20, 0))
 
         self.create_nav_buttons(
@@ -251,8 +444,7 @@ class InstallerApp:
         ttk.Label(
             ui_frame,
             text="Graphical interface for running tools. Adds ~150MB.",
-            font=("Helvetica", 9),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(anchor="w", padx=(25, 0))
 
         # Analysis option
@@ -268,8 +460,7 @@ class InstallerApp:
         ttk.Label(
             analysis_frame,
             text="Required for face detection and saliency analysis in Smart Reframer.",
-            font=("Helvetica", 9),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(anchor="w", padx=(25, 0))
 
         # Dev mode option
@@ -285,8 +476,7 @@ class InstallerApp:
         ttk.Label(
             dev_frame,
             text="For developers who want to modify the source code.",
-            font=("Helvetica", 9),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(anchor="w", padx=(25, 0))
 
         self.create_nav_buttons(
@@ -313,14 +503,13 @@ class InstallerApp:
             ttk.Label(
                 content,
                 text="DaVinci Resolve was detected automatically:",
-                font=("Helvetica", 10)
+                style="Body.TLabel"
             ).pack(anchor="w")
         else:
             ttk.Label(
                 content,
                 text="DaVinci Resolve was not detected. Please specify the path:",
-                font=("Helvetica", 10),
-                foreground="orange"
+                style="Warning.TLabel"
             ).pack(anchor="w")
 
         path_frame = ttk.Frame(content)
@@ -341,30 +530,20 @@ class InstallerApp:
         ttk.Label(
             content,
             text="Common locations:",
-            font=("Helvetica", 9, "bold")
+            style="SmallBold.TLabel"
         ).pack(anchor="w", pady=(20, 5))
 
-        locations = []
-        if IS_LINUX:
-            locations = ["/opt/resolve/Developer/Scripting/Modules"]
-        elif IS_MACOS:
-            locations = ["/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"]
-        elif IS_WINDOWS:
-            locations = [r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting\Modules"]
-
-        for loc in locations:
+        for loc in RESOLVE_CANDIDATE_PATHS:
             ttk.Label(
                 content,
                 text=loc,
-                font=("Helvetica", 9),
-                foreground="gray"
+                style="Hint.TLabel"
             ).pack(anchor="w")
 
         ttk.Label(
             content,
             text="\nNote: You can leave this empty if Resolve is not installed yet.\nYou can set the RESOLVE_SCRIPT_API environment variable later.",
-            font=("Helvetica", 9),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(anchor="w", pady=(20, 0))
 
         self.create_nav_buttons(
@@ -380,6 +559,7 @@ class InstallerApp:
         )
         if path:
             self.resolve_path.set(path)
+            forget_detected_resolve()
 
     def create_install_page(self):
         """Page 3: Installation progress."""
@@ -405,7 +585,7 @@ class InstallerApp:
         self.status_label = ttk.Label(
             content,
             text="Preparing installation...",
-            font=("Helvetica", 10)
+            style="Body.TLabel"
         )
         self.status_label.pack()
 
@@ -413,19 +593,30 @@ class InstallerApp:
         log_frame = ttk.Frame(content)
         log_frame.pack(fill="both", expand=True, pady=(20, 0))
 
+        # Append-only log: no undo history to grow per insert, and no
+        # re-wrapping of long pip lines (they scroll horizontally instead)
         self.log_text = tk.Text(
             log_frame,
             height=10,
             width=60,
             font=("Courier", 9),
-            state="disabled"
+            state="disabled",
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
+            wrap="none"
         )
-        self.log_text.pack(side="left", fill="both", expand=True)
 
         scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
         scrollbar.pack(side="right", fill="y")
         self.log_text.config(yscrollcommand=scrollbar.set)
 
+        xscrollbar = ttk.Scrollbar(log_frame, orient="horizontal", command=self.log_text.xview)
+        xscrollbar.pack(side="bottom", fill="x")
+        self.log_text.config(xscrollcommand=xscrollbar.set)
+
+        self.log_text.pack(side="left", fill="both", expand=True)
+
     def create_complete_page(self):
         """Page 4: Installation complete."""
         page = ttk.Frame(self.root)
@@ -443,39 +634,24 @@ class InstallerApp:
         ttk.Label(
             content,
             text="The suite is now ready to use.",
-            font=("Helvetica", 11)
+            style="Large.TLabel"
         ).pack(anchor="w", pady=(0, 20))
 
         ttk.Label(
             content,
             text="Quick Start:",
-            font=("Helvetica", 10, "bold")
+            style="Bold.TLabel"
         ).pack(anchor="w")
 
-        commands = [
-            "",
-            "List all tools:",
-            "  resolve-suite list",
-            "",
-            "Run a tool:",
-            "  resolve-suite run t1_revision_resolver --dry-run",
-            "",
-            "Check for updates:",
-            "  resolve-suite update"
-        ]
-
+        commands = QUICK_START_COMMANDS
         if self.install_ui.get():
-            commands.extend([
-                "",
-                "Launch Desktop UI:",
-                "  resolve-suite-ui"
-            ])
+            commands += UI_LAUNCH_COMMANDS
 
         for cmd in commands:
             ttk.Label(
                 content,
                 text=cmd,
-                font=("Courier", 9) if cmd.startswith("  ") else ("Helvetica", 9)
+                style="Mono.TLabel" if cmd.startswith("  ") else "Small.TLabel"
             ).pack(anchor="w")
 
         # Close button
@@ -491,28 +667,67 @@ class InstallerApp:
 
     def show_page(self, page_num):
         """Switch to a different page."""
-        # Hide all pages
-        for page in self.pages.values():
-            page.pack_forget()
+        # Only the current page is packed, so it's the only one to hide
+        if self.current_page in self.pages:
+            self.pages[self.current_page].pack_forget()
 
         # Show requested page
+        if page_num not in self.pages:
+            self._page_factories[page_num]()
         self.current_page = page_num
         self.pages[page_num].pack(fill="both", expand=True)
 
     def log(self, message):
-        """Add message to log."""
+        """Add message to log (safe to call from the install thread)."""
+        self._ui_queue.put(("log", message))
+
+    def update_progress(self, value, status=""):
+        """Update progress bar and status (safe to call from the install thread)."""
+        self._ui_queue.put(("progress", value, status))
+
+    def _pump_ui(self):
+        """Apply everything the install thread has queued, then reschedule."""
+        messages = []
+        while True:
+            try:
+                messages.append(self._ui_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        lines = []
+        for kind, *args in messages:
+            if kind == "log":
+                lines.append(args[0])
+            elif kind == "progress":
+                self._set_progress(*args)
+            elif kind == "show":
+                page_num, delay_ms = args
+                self.root.after(delay_ms, self.show_page, page_num)
+            elif kind == "error":
+                # Get the log on screen before the modal dialog
+                self._write_log(lines)
+                lines = []
+                messagebox.showerror(*args)
+        self._write_log(lines)
+
+        self.root.after(UI_POLL_MS, self._pump_ui)
+
+    def _write_log(self, lines):
+        """Write log lines with one insert, keeping the last LOG_MAX_LINES."""
+        if not lines:
+            return
         self.log_text.config(state="normal")
-        self.log_text.insert("end", message + "\n")
+        self.log_text.insert("end", "\n".join(lines) + "\n")
+        count = int(self.log_text.index("end-1c").split(".")[0])
+        if count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{count - LOG_MAX_LINES}.0")
         self.log_text.see("end")
         self.log_text.config(state="disabled")
-        self.root.update()
 
-    def update_progress(self, value, status=""):
-        """Update progress bar and status."""
+    def _set_progress(self, value, status):
         self.progress["value"] = value
         if status:
             self.status_label.config(text=status)
-        self.root.update()
 
     def start_install(self):
         """Begin installation in background thread."""
@@ -523,59 +738,48 @@ class InstallerApp:
     def run_install(self):
         """Run the actual installation."""
         try:
-            python = sys.executable
-
             # Step 1: Create virtual environment
             self.update_progress(10, "Creating virtual environment...")
             self.log("Creating virtual environment...")
 
-            if VENV_DIR.exists():
-                self.log("Virtual environment already exists, reusing...")
-            else:
-                result = subprocess.run(
-                    [python, "-m", "venv", str(VENV_DIR)],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
-                    raise Exception(f"Failed to create venv: {result.stderr}")
-
-            self.log("Virtual environment ready.")
-
-            # Get pip path
             if IS_WINDOWS:
-                pip = VENV_DIR / "Scripts" / "pip.exe"
                 venv_python = VENV_DIR / "Scripts" / "python.exe"
             else:
-                pip = VENV_DIR / "bin" / "pip"
                 venv_python = VENV_DIR / "bin" / "python"
 
-            # Step 2: Upgrade pip
-            self.update_progress(20, "Upgrading pip...")
-            self.log("Upgrading pip and setuptools...")
+            # The interpreter is the one file a usable venv can't lack; a
+            # half-created .venv is rebuilt here instead of failing in pip later
+            if venv_python.exists():
+                self.log("Virtual environment already exists, reusing...")
+            else:
+                if VENV_DIR.exists():
+                    self.log("Existing virtual environment is incomplete, recreating...")
+                # No upgrade_deps here: step 2 reads the bundled pip's version
+                # and only pulls a newer one when it is below PIP_MIN_VERSION
+                import venv
+                venv.EnvBuilder(
+                    with_pip=True, clear=True, symlinks=not IS_WINDOWS
+                ).create(str(VENV_DIR))
+
+            self.log("Virtual environment ready.")
 
-            result = subprocess.run(
-                [str(pip), "install", "--upgrade", "pip", "setuptools", "wheel"],
-                capture_output=True,
-                text=True
-            )
-            self.log("pip upgraded.")
+            # Step 2: Install pip tooling, base dependencies and the package
+            self.update_progress(20, "Installing Resolve Production Suite...")
+            self.log("Installing dependencies and main package...")
 
-            # Step 3: Install base dependencies
-            self.update_progress(35, "Installing base dependencies...")
-            self.log("Installing base dependencies...")
+            # python -m pip so pip can upgrade itself on Windows; skip pip's
+            # own PyPI version check and never stop to ask for input
+            pip_install = [str(venv_python), "-m", "pip", "install",
+                           "--disable-pip-version-check", "--no-input"]
+            # Specs only, no --upgrade, so an old pip is replaced without also
+            # upgrading every dependency that is already installed
+            min_pip = ".".join(map(str, PIP_MIN_VERSION))
+            tooling = [f"pip>={min_pip}", "setuptools", "wheel"]
 
+            packages = []
             req_file = SCRIPT_DIR / "requirements.txt"
             if req_file.exists():
-                result = subprocess.run(
-                    [str(pip), "install", "-r", str(req_file)],
-                    capture_output=True,
-                    text=True
-                )
-
-            # Step 4: Install package
-            self.update_progress(50, "Installing Resolve Production Suite...")
-            self.log("Installing main package...")
+                packages += ["-r", str(req_file)]
 
             extras = []
             if self.install_ui.get():
@@ -587,34 +791,46 @@ class InstallerApp:
             if extras:
                 install_spec += f"[{','.join(extras)}]"
 
-            cmd = [str(pip), "install"]
             if self.dev_mode.get():
-                cmd.append("-e")
-            cmd.append(install_spec)
+                packages.append("-e")
+            packages.append(install_spec)
+
+            # pip 23.0+ (what current Pythons bundle) installs the packages as
+            # is; only an older one gets the tooling specs added to the same run.
+            # The build backend comes from pyproject.toml either way
+            if venv_pip_version(VENV_DIR) >= PIP_MIN_VERSION:
+                upgrade = []
+            else:
+                upgrade = tooling
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                self.log(f"Warning: {result.stderr}")
+            if run_streaming(pip_install + upgrade + packages, self.log) != 0:
+                # Whichever pip ran could not handle the request: force the
+                # tooling to its latest in a run of its own, then install again
+                self.log("Combined install failed, upgrading pip first...")
+                run_streaming(pip_install + ["--upgrade"] + tooling, self.log)
+                if run_streaming(pip_install + packages, self.log) != 0:
+                    self.log("Warning: package installation reported errors (see above)")
 
             self.log("Package installed.")
 
-            # Step 5: Create directories
+            # Step 3: Create directories
             self.update_progress(70, "Creating data directories...")
             self.log("Creating data directories...")
 
-            rps_home = Path.home() / ".rps"
-            for subdir in ["logs", "reports", "presets", "packs"]:
-                (rps_home / subdir).mkdir(parents=True, exist_ok=True)
+            # Create the shared parent once; the children then need one mkdir each
+            RPS_HOME.mkdir(parents=True, exist_ok=True)
+            for subdir in ("logs", "reports", "presets", "packs"):
+                (RPS_HOME / subdir).mkdir(exist_ok=True)
 
-            self.log(f"Created: {rps_home}")
+            self.log(f"Created: {RPS_HOME}")
 
-            # Step 6: Create launcher scripts
+            # Step 4: Create launcher scripts
             self.update_progress(85, "Creating launcher scripts...")
             self.log("Creating launcher scripts...")
 
             self.create_launchers()
 
-            # Step 7: Set environment variable
+            # Step 5: Set environment variable
             if self.resolve_path.get():
                 self.log(f"Resolve path: {self.resolve_path.get()}")
                 self.create_env_script()
@@ -623,11 +839,11 @@ class InstallerApp:
             self.log("\nInstallation completed successfully!")
 
             # Show complete page
-            self.root.after(1000, lambda: self.show_page(4))
+            self._ui_queue.put(("show", 4, 1000))
 
         except Exception as e:
             self.log(f"\nError: {e}")
-            messagebox.showerror("Installation Error", str(e))
+            self._ui_queue.put(("error", "Installation Error", str(e)))
 
     def create_launchers(self):
         """Create launcher scripts."""
@@ -636,37 +852,25 @@ class InstallerApp:
             venv_scripts = VENV_DIR / "Scripts"
 
             cli_launcher = SCRIPT_DIR / "resolve-suite.bat"
-            cli_launcher.write_text(f"""@echo off
-call "{venv_scripts}\\activate.bat"
-python -m cli.main %*
-""")
+            cli_launcher.write_text(CLI_BAT_TEMPLATE.substitute(scripts=venv_scripts))
             self.log(f"Created: {cli_launcher}")
 
             if self.install_ui.get():
                 ui_launcher = SCRIPT_DIR / "resolve-suite-ui.bat"
-                ui_launcher.write_text(f"""@echo off
-call "{venv_scripts}\\activate.bat"
-pythonw -m ui.app %*
-""")
+                ui_launcher.write_text(UI_BAT_TEMPLATE.substitute(scripts=venv_scripts))
                 self.log(f"Created: {ui_launcher}")
         else:
             # Unix shell scripts
             venv_bin = VENV_DIR / "bin"
 
             cli_launcher = SCRIPT_DIR / "resolve-suite"
-            cli_launcher.write_text(f"""#!/usr/bin/env bash
-source "{venv_bin}/activate"
-python -m cli.main "$@"
-""")
+            cli_launcher.write_text(CLI_SH_TEMPLATE.substitute(bin=venv_bin))
             cli_launcher.chmod(0o755)
             self.log(f"Created: {cli_launcher}")
 
             if self.install_ui.get():
                 ui_launcher = SCRIPT_DIR / "resolve-suite-ui"
-                ui_launcher.write_text(f"""#!/usr/bin/env bash
-source "{venv_bin}/activate"
-python -m ui.app "$@"
-""")
+                ui_launcher.write_text(UI_SH_TEMPLATE.substitute(bin=venv_bin))
                 ui_launcher.chmod(0o755)
                 self.log(f"Created: {ui_launcher}")
 
@@ -676,18 +880,10 @@ python -m ui.app "$@"
 
         if IS_WINDOWS:
             env_script = SCRIPT_DIR / "rps_env.bat"
-            env_script.write_text(f"""@echo off
-set RPS_HOME=%USERPROFILE%\\.rps
-set RESOLVE_SCRIPT_API={resolve_path}
-set PATH=%PATH%;{VENV_DIR}\\Scripts
-""")
+            env_script.write_text(ENV_BAT_TEMPLATE.substitute(resolve=resolve_path, venv=VENV_DIR))
         else:
             env_script = SCRIPT_DIR / "rps_env.sh"
-            env_script.write_text(f"""#!/usr/bin/env bash
-export RPS_HOME="$HOME/.rps"
-export RESOLVE_SCRIPT_API="{resolve_path}"
-export PATH="$PATH:{VENV_DIR}/bin"
-""")
+            env_script.write_text(ENV_SH_TEMPLATE.substitute(resolve=resolve_path, venv=VENV_DIR))
             env_script.chmod(0o755)
 
         self.log(f"Created: {env_script}")
@@ -726,6 +922,18 @@ def main():
         except:
             pass
 
+    # Label styles shared by every page, so each font is created once
+    style.configure("Header.TLabel", font=("Helvetica", 16, "bold"))
+    style.configure("Subtitle.TLabel", font=("Helvetica", 10), foreground="gray")
+    style.configure("Body.TLabel", font=("Helvetica", 10))
+    style.configure("Bold.TLabel", font=("Helvetica", 10, "bold"))
+    style.configure("Large.TLabel", font=("Helvetica", 11))
+    style.configure("Small.TLabel", font=("Helvetica", 9))
+    style.configure("SmallBold.TLabel", font=("Helvetica", 9, "bold"))
+    style.configure("Hint.TLabel", font=("Helvetica", 9), foreground="gray")
+    style.configure("Warning.TLabel", font=("Helvetica", 10), foreground="orange")
+    style.configure("Mono.TLabel", font=("Courier", 9))
+
     app = InstallerApp(root)
     root.mainloop()
 
@@ -13,13 +13,15 @@ This creates:
         ResolveProductionSuite-macOS.zip
 """
 
+import concurrent.futures
+import functools
 import os
-import shutil
 import subprocess
+import time
+import zipfile
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
-RELEASES_DIR = SCRIPT_DIR / "releases"
 DIST_DIR = SCRIPT_DIR / "dist"
 VERSION = (SCRIPT_DIR / "VERSION").read_text().strip() if (SCRIPT_DIR / "VERSION").exists() else "0.2.0"
 
@@ -27,108 +29,145 @@ VERSION = (SCRIPT_DIR / "VERSION").read_text().strip() if (SCRIPT_DIR / "VERSION
 SOURCE_FOLDERS = ["cli", "core", "docs", "presets", "resolve", "sample_data", "schemas", "scripts", "tools", "ui"]
 SOURCE_FILES = ["installer.py", "LICENSE", "README.md", "VERSION", "pyproject.toml", "requirements.txt"]
 
-
-def clean_pycache(directory):
-    """Remove all __pycache__ directories."""
-    for pycache in directory.rglob("__pycache__"):
-        shutil.rmtree(pycache)
-
-
-def package_windows():
-    """Package Windows release."""
-    print("\n[Windows]")
-    win_dir = RELEASES_DIR / "Windows"
-
-    # Clean and recreate
-    if win_dir.exists():
-        shutil.rmtree(win_dir)
-    win_dir.mkdir(parents=True)
-
-    # Copy source files
+# Already-compressed formats are stored as-is; deflating them again only costs CPU
+PRECOMPRESSED = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp4", ".mov", ".mp3",
+                 ".zip", ".gz", ".xz", ".bz2", ".7z"}
+
+# Level 3 is much faster than zlib's default 6 and only slightly larger for text
+COMPRESS_LEVEL = 3
+
+
+def _zipinfo(arcname, st):
+    """Build a ZipInfo from a stat result we already hold (ZipInfo.from_file stats again)."""
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)  # earliest time a zip can record
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    return zinfo
+
+
+def _write_entry(zf, path, arcname, st):
+    """Add one file to zf, stored if it is already compressed, else deflated.
+
+    The entry header is built from st, so ZipFile.write's own stat is skipped.
+    """
+    stored = os.path.splitext(path)[1].lower() in PRECOMPRESSED
+    with open(path, "rb") as f:
+        data = f.read()
+    zf.writestr(_zipinfo(arcname, st), data,
+                compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+                compresslevel=COMPRESS_LEVEL)
+
+
+def _walk_source_files(directory, rel_dir):
+    """Yield (path, relative posix path, stat) for every file under directory.
+
+    A plain os.scandir recursion: DirEntry.is_dir() answers from the
+    directory listing itself, so nothing is stat'ed just to be skipped.
+    Bytecode is never packaged: __pycache__ folders are not entered and
+    stray .pyc/.pyo files are skipped. Entries come out sorted.
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        rel = f"{rel_dir}/{entry.name}"
+        if entry.is_dir():
+            if entry.name != "__pycache__":
+                yield from _walk_source_files(entry.path, rel)
+        elif not entry.name.endswith((".pyc", ".pyo")):
+            yield entry.path, rel, entry.stat()
+
+
+def _collect_manifest():
+    """List the source files every package contains, as (path, relative path, stat).
+
+    Walked once per run and shared by all platforms.
+    """
+    # One listing of SCRIPT_DIR answers every "does this folder/file exist?"
+    with os.scandir(SCRIPT_DIR) as it:
+        top = {entry.name: entry for entry in it}
+
+    manifest = []
     for folder in SOURCE_FOLDERS:
-        src = SCRIPT_DIR / folder
-        if src.exists():
-            shutil.copytree(src, win_dir / folder)
+        entry = top.get(folder)
+        if entry is not None and entry.is_dir():
+            manifest.extend(_walk_source_files(entry.path, folder))
 
     for file in SOURCE_FILES:
-        src = SCRIPT_DIR / file
-        if src.exists():
-            shutil.copy2(src, win_dir / file)
-
-    # Copy Windows-specific launcher
-    launcher = SCRIPT_DIR / "releases" / "Windows" / "CLICK_ME_FIRST.bat"
-    if not launcher.exists():
-        # Create the launcher
-        create_windows_launcher(win_dir)
-
-    # Create README
-    create_windows_readme(win_dir)
-
-    # Clean pycache
-    clean_pycache(win_dir)
+        entry = top.get(file)
+        if entry is not None and entry.is_file():
+            manifest.append((entry.path, file, entry.stat()))
+    return tuple(manifest)
+
+
+def write_release_zip(zip_path, top, manifest, generated):
+    """Zip the manifest's files straight from SCRIPT_DIR, plus generated files, under top/.
+
+    generated maps file names to (data, executable) for the launcher and
+    README, which are written from memory as already-encoded bytes.
+    Nothing is staged: each source file is read once, by the compressor.
+    """
+    # Build under a temporary name and swap it in at the end, so an
+    # interrupted run never leaves a truncated zip in dist/
+    part_path = zip_path.with_name(zip_path.name + ".part")
+    try:
+        with zipfile.ZipFile(part_path, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as zf:
+            for path, rel, st in manifest:
+                _write_entry(zf, path, f"{top}/{rel}", st)
+
+            now = time.localtime()[:6]
+            for name, (data, executable) in generated.items():
+                zinfo = zipfile.ZipInfo(f"{top}/{name}", now)
+                # Keep the launcher executable once unzipped on macOS
+                zinfo.external_attr = (0o100755 if executable else 0o100644) << 16
+                zf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED,
+                            compresslevel=COMPRESS_LEVEL)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    os.replace(part_path, zip_path)
+
+
+def _encode_text(name, text):
+    """Encode a generated file as UTF-8, with CRLF line endings for .bat files.
+
+    The bytes don't depend on the platform or locale the release is built on.
+    cmd.exe can misread labels in a batch file with bare LF endings, so
+    .bat files always get CRLF; everything else keeps LF.
+    """
+    if name.endswith(".bat"):
+        text = text.replace("\r\n", "\n").replace("\n", "\r\n")
+    return text.encode("utf-8")
+
+
+def _package(platform_name, launcher_name, create_launcher, create_readme, manifest):
+    """Package one platform's release as dist/ResolveProductionSuite-<platform_name>.zip.
+
+    Returns the progress report instead of printing it, so platforms
+    packaged at the same time don't interleave their output.
+    """
+    report = [f"\n[{platform_name}]"]
+
+    # The launcher and README go into the zip straight from memory
+    generated = {
+        launcher_name: (_encode_text(launcher_name, create_launcher()),
+                        launcher_name.endswith(".command")),
+        "README.txt": (_encode_text("README.txt", create_readme()), False),
+    }
 
     # Create zip
-    zip_path = DIST_DIR / "ResolveProductionSuite-Windows.zip"
-    if zip_path.exists():
-        zip_path.unlink()
-
-    shutil.make_archive(
-        str(DIST_DIR / "ResolveProductionSuite-Windows"),
-        'zip',
-        RELEASES_DIR,
-        "Windows"
-    )
-    print(f"  Created: dist/ResolveProductionSuite-Windows.zip")
-
-
-def package_macos():
-    """Package macOS release."""
-    print("\n[macOS]")
-    mac_dir = RELEASES_DIR / "macOS"
-
-    # Clean and recreate
-    if mac_dir.exists():
-        shutil.rmtree(mac_dir)
-    mac_dir.mkdir(parents=True)
-
-    # Copy source files
-    for folder in SOURCE_FOLDERS:
-        src = SCRIPT_DIR / folder
-        if src.exists():
-            shutil.copytree(src, mac_dir / folder)
-
-    for file in SOURCE_FILES:
-        src = SCRIPT_DIR / file
-        if src.exists():
-            shutil.copy2(src, mac_dir / file)
+    zip_path = DIST_DIR / f"ResolveProductionSuite-{platform_name}.zip"
 
-    # Create macOS launcher
-    create_macos_launcher(mac_dir)
+    write_release_zip(zip_path, platform_name, manifest, generated)
+    report += [f"  Created: {name}" for name in generated]
+    report.append(f"  Created: dist/ResolveProductionSuite-{platform_name}.zip")
+    return "\n".join(report)
 
-    # Create README
-    create_macos_readme(mac_dir)
 
-    # Clean pycache
-    clean_pycache(mac_dir)
-
-    # Create zip
-    zip_path = DIST_DIR / "ResolveProductionSuite-macOS.zip"
-    if zip_path.exists():
-        zip_path.unlink()
-
-    shutil.make_archive(
-        str(DIST_DIR / "ResolveProductionSuite-macOS"),
-        'zip',
-        RELEASES_DIR,
-        "macOS"
-    )
-    print(f"  Created: dist/ResolveProductionSuite-macOS.zip")
-
-
-def create_windows_launcher(dest_dir):
-    """Create Windows batch launcher."""
-    launcher = dest_dir / "CLICK_ME_FIRST.bat"
-    launcher.write_text(r'''@echo off
+def create_windows_launcher():
+    """Text of the Windows batch launcher."""
+    return r'''@echo off
 setlocal EnableDelayedExpansion
 title Resolve Production Suite - Windows Installer
 color 0B
@@ -170,24 +209,19 @@ if exist "C:\Python312\python.exe" (
     goto :found_python
 )
 
-REM Try py launcher (but check it's not the Microsoft Store stub)
-where py >nul 2>&1
-if %ERRORLEVEL% EQU 0 (
-    py -3 --version >nul 2>&1
-    if !ERRORLEVEL! EQU 0 (
-        set "PYTHON_PATH=py -3"
-        goto :found_python
-    )
+REM Try py launcher. A missing command just fails the version check,
+REM so there is no separate "where" lookup (each one starts where.exe)
+py -3 --version >nul 2>&1
+if !ERRORLEVEL! EQU 0 (
+    set "PYTHON_PATH=py -3"
+    goto :found_python
 )
 
-REM Try python command
-where python >nul 2>&1
-if %ERRORLEVEL% EQU 0 (
-    python --version 2>&1 | findstr /C:"Python 3" >nul
-    if !ERRORLEVEL! EQU 0 (
-        set "PYTHON_PATH=python"
-        goto :found_python
-    )
+REM Try python command (but check it's not the Microsoft Store stub)
+python --version 2>&1 | findstr /C:"Python 3" >nul
+if !ERRORLEVEL! EQU 0 (
+    set "PYTHON_PATH=python"
+    goto :found_python
 )
 
 REM Python not found - need to install
@@ -306,14 +340,12 @@ if %ERRORLEVEL% NEQ 0 (
 echo.
 pause
 endlocal
-''')
-    print("  Created: CLICK_ME_FIRST.bat")
+'''
 
 
-def create_windows_readme(dest_dir):
-    """Create Windows README."""
-    readme = dest_dir / "README.txt"
-    readme.write_text(f"""================================================================================
+def create_windows_readme():
+    """Text of the Windows README."""
+    return f"""================================================================================
                     RESOLVE PRODUCTION SUITE v{VERSION}
 ================================================================================
 
@@ -388,14 +420,12 @@ Email: contactmukundthiru@gmail.com
 Docs:  See the docs/ folder for complete documentation
 
 ================================================================================
-""")
-    print("  Created: README.txt")
+"""
 
 
-def create_macos_launcher(dest_dir):
-    """Create macOS shell launcher."""
-    launcher = dest_dir / "DOUBLE_CLICK_ME.command"
-    launcher.write_text('''#!/bin/bash
+def create_macos_launcher():
+    """Text of the macOS shell launcher."""
+    return '''#!/bin/bash
 #
 # Resolve Production Suite - macOS Installer
 # Double-click this file to install
@@ -570,15 +600,12 @@ $PYTHON_CMD installer.py
 
 echo ""
 read -p "Press Enter to close..."
-''')
-    launcher.chmod(0o755)
-    print("  Created: DOUBLE_CLICK_ME.command")
+'''
 
 
-def create_macos_readme(dest_dir):
-    """Create macOS README."""
-    readme = dest_dir / "README.txt"
-    readme.write_text(f"""================================================================================
+def create_macos_readme():
+    """Text of the macOS README."""
+    return f"""================================================================================
                     RESOLVE PRODUCTION SUITE v{VERSION}
 ================================================================================
 
@@ -654,8 +681,13 @@ Email: contactmukundthiru@gmail.com
 Docs:  See the docs/ folder for complete documentation
 
 ================================================================================
-""")
-    print("  Created: README.txt")
+"""
+
+
+package_windows = functools.partial(
+    _package, "Windows", "CLICK_ME_FIRST.bat", create_windows_launcher, create_windows_readme)
+package_macos = functools.partial(
+    _package, "macOS", "DOUBLE_CLICK_ME.command", create_macos_launcher, create_macos_readme)
 
 
 def main():
@@ -665,9 +697,14 @@ def main():
     # Ensure dist directory exists
     DIST_DIR.mkdir(exist_ok=True)
 
-    # Package both platforms
-    package_windows()
-    package_macos()
+    # Both platforms ship the same sources: walk them once
+    manifest = _collect_manifest()
+
+    # Package both platforms at once; compression and file I/O release the GIL
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        jobs = [ex.submit(package_windows, manifest), ex.submit(package_macos, manifest)]
+        for job in jobs:
+            print(job.result())
 
     print("\n" + "=" * 50)
     print("DONE! Ready for Gumroad upload:")
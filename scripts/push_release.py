@@ -7,8 +7,8 @@ Usage:
 
 This will:
 1. Update VERSION file
-2. Update version.json
-3. Rebuild packages (calls package_release.py)
+2. Rebuild packages (calls package_release.py)
+3. Update version.json (including SHA-256 checksums of the zips)
 4. Create git tag
 5. Push to GitHub
 6. Create GitHub release with zip files attached
@@ -18,6 +18,7 @@ Requirements:
     - Git configured with push access
 """
 
+import hashlib
 import json
 import subprocess
 import sys
@@ -46,8 +47,19 @@ def update_version(new_version):
     print(f"  Updated VERSION to {new_version}")
 
 
+def sha256_file(path):
+    """Hex SHA-256 of a file, or None if it does not exist."""
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 def update_version_json(new_version, changelog):
-    """Update version.json file."""
+    """Update version.json file (after packages are built, so checksums match)."""
     json_file = PROJECT_DIR / "version.json"
 
     data = {
@@ -56,8 +68,11 @@ def update_version_json(new_version, changelog):
         "min_python": "3.9",
         "changelog": changelog,
         "download_url": f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/releases/latest",
-        "windows_url": f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/releases/latest/download/ResolveProductionSuite-Windows.zip",
-        "macos_url": f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/releases/latest/download/ResolveProductionSuite-macOS.zip",
+        # Pinned to this release's tag, so the checksums below always match
+        "windows_url": f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/releases/download/v{new_version}/ResolveProductionSuite-Windows.zip",
+        "macos_url": f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/releases/download/v{new_version}/ResolveProductionSuite-macOS.zip",
+        "windows_sha256": sha256_file(PROJECT_DIR / "dist" / "ResolveProductionSuite-Windows.zip"),
+        "macos_sha256": sha256_file(PROJECT_DIR / "dist" / "ResolveProductionSuite-macOS.zip"),
         "support_email": "contactmukundthiru@gmail.com"
     }
 
@@ -185,11 +200,11 @@ def main():
 
     print("\n1. Updating version files...")
     update_version(new_version)
-    update_version_json(new_version, changelog)
     update_installer_version(new_version)
 
     print("\n2. Building packages...")
     build_packages()
+    update_version_json(new_version, changelog)
 
     print("\n3. Git commit and tag...")
     git_commit_and_tag(new_version, changelog)